@@ -4,22 +4,34 @@ Main FastAPI application entry point.
 This module serves as the entry point for the document classification system,
 initializing the FastAPI application and routing.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 
-from src.api.routes import router as api_router
 from src.utils.config import settings
 from src.utils.logging_config import setup_logging
 
-# Initialize logging
+# Initialize logging before the API modules create their clients and log
 setup_logging()
 
+from src.api.routes import router as api_router, classification_agent, result_storage  # noqa: E402
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan - flush results and close AWS clients on shutdown."""
+    yield
+    await result_storage.close()
+    await classification_agent.close()
+
 app = FastAPI(
     title="Document Classification System",
     description="Automatically classify home loan application documents using AWS Textract and Bedrock",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Mount static files
@@ -51,7 +51,7 @@ class RateLimiter:
             HTTPException: If rate limit exceeded.
         """
         client_ip = request.client.host
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Get or create request history for client
         if client_ip not in rate_limit_storage:
@@ -5,10 +5,12 @@ This module defines all API endpoints for file upload, status checking,
 and result retrieval with proper error handling and background processing.
 """
 
+import json
 import uuid
+import asyncio
 from datetime import datetime
-from typing import Dict, Any, List
-from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Form
+from typing import Dict, Any, List, Tuple
+from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Form, Query
 import logging
 
 from .models import (
@@ -20,6 +22,7 @@ from .models import (
 )
 from ..classification.agent import DocumentClassificationAgent
 from ..utils.file_handler import FileValidator, FileStorage, ResultStorage
+from ..utils.json_utils import json_loads
 from ..utils.config import settings
 from ..evaluation.metrics import MetricsCalculator
 
@@ -38,6 +41,31 @@ metrics_calculator = MetricsCalculator()
 # In-memory task status tracking (use Redis in production)
 task_status: Dict[str, str] = {}
 task_progress: Dict[str, str] = {}
+# Set when a task reaches a final status, for status requests waiting on it.
+# Entries exist only while at least one request is waiting.
+task_finished: Dict[str, asyncio.Event] = {}
+task_waiters: Dict[str, int] = {}
+
+# Longest a status request may wait for its task to finish
+MAX_STATUS_WAIT_SECONDS = 30.0
+
+
+def _finish_task(task_id: str, status: ProcessingStatus, progress: str) -> None:
+    """
+    Record a final task status and wake status requests waiting on it.
+
+    Args:
+        task_id: Unique task identifier.
+        status: Final status, completed or failed.
+        progress: Final progress message.
+    """
+    task_status[task_id] = status.value
+    task_progress[task_id] = progress
+
+    finished = task_finished.pop(task_id, None)
+    task_waiters.pop(task_id, None)
+    if finished is not None:
+        finished.set()
 
 
 async def classify_document_task(pdf_bytes: bytes, task_id: str, filename: str) -> None:
@@ -67,8 +95,9 @@ async def classify_document_task(pdf_bytes: bytes, task_id: str, filename: str)
         await result_storage.save_result(task_id, result)
 
         # Update final status
-        task_status[task_id] = ProcessingStatus.COMPLETED.value
-        task_progress[task_id] = "Classification completed successfully"
+        _finish_task(
+            task_id, ProcessingStatus.COMPLETED, "Classification completed successfully"
+        )
 
         logger.info(f"Background classification completed for task {task_id}")
 
@@ -91,8 +120,29 @@ async def classify_document_task(pdf_bytes: bytes, task_id: str, filename: str)
                 f"Failed to save error result for task {task_id}: {save_error}"
             )
 
-        task_status[task_id] = ProcessingStatus.FAILED.value
-        task_progress[task_id] = f"Classification failed: {str(e)}"
+        _finish_task(
+            task_id, ProcessingStatus.FAILED, f"Classification failed: {str(e)}"
+        )
+
+
+async def classify_documents_task(documents: List[Tuple[bytes, str, str]]) -> None:
+    """
+    Background task for classifying a batch of documents concurrently.
+
+    BackgroundTasks runs queued tasks one after another, so batches are
+    scheduled as a single task that overlaps extraction of one document
+    with classification of another. The Textract and Bedrock client
+    semaphores bound how many AWS requests are in flight.
+
+    Args:
+        documents: (pdf_bytes, task_id, filename) for each document.
+    """
+    await asyncio.gather(
+        *(
+            classify_document_task(pdf_bytes, task_id, filename)
+            for pdf_bytes, task_id, filename in documents
+        )
+    )
 
 
 @router.post("/upload-document/", response_model=UploadResponse)
@@ -147,12 +197,16 @@ async def upload_document(
 
 
 @router.get("/status/{task_id}", response_model=TaskStatusResponse)
-async def get_task_status(task_id: str) -> TaskStatusResponse:
+async def get_task_status(
+    task_id: str, wait: float = Query(0, ge=0, le=MAX_STATUS_WAIT_SECONDS)
+) -> TaskStatusResponse:
     """
     Get processing status for a task.
 
     Args:
         task_id: Unique task identifier.
+        wait: Seconds to wait for the task to finish before answering,
+            so clients can long-poll instead of polling repeatedly.
 
     Returns:
         TaskStatusResponse: Current task status.
@@ -163,6 +217,28 @@ async def get_task_status(task_id: str) -> TaskStatusResponse:
     if task_id not in task_status:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    if wait > 0 and task_status[task_id] not in (
+        ProcessingStatus.COMPLETED.value,
+        ProcessingStatus.FAILED.value,
+    ):
+        finished = task_finished.get(task_id)
+        if finished is None:
+            finished = task_finished[task_id] = asyncio.Event()
+        task_waiters[task_id] = task_waiters.get(task_id, 0) + 1
+        try:
+            await asyncio.wait_for(finished.wait(), timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # Drop the event once the last waiter for an unfinished task leaves
+            if task_finished.get(task_id) is finished:
+                remaining = task_waiters[task_id] - 1
+                if remaining:
+                    task_waiters[task_id] = remaining
+                else:
+                    del task_finished[task_id]
+                    del task_waiters[task_id]
+
     current_status = task_status[task_id]
     progress = task_progress.get(task_id, "No progress information available")
 
@@ -308,8 +384,7 @@ async def cancel_task(task_id: str) -> Dict[str, str]:
         }
 
     # Cancel queued task
-    task_status[task_id] = ProcessingStatus.FAILED.value
-    task_progress[task_id] = "Task cancelled by user"
+    _finish_task(task_id, ProcessingStatus.FAILED, "Task cancelled by user")
 
     return {
         "message": "Task cancelled successfully",
@@ -399,6 +474,7 @@ async def batch_upload(
 
     batch_id = str(uuid.uuid4())
     task_ids = []
+    documents = []
     successful_uploads = 0
     errors = []
 
@@ -414,17 +490,17 @@ async def batch_upload(
             # Initialize task tracking
             task_status[task_id] = ProcessingStatus.QUEUED.value
             task_progress[task_id] = f"Batch {batch_id}: Queued for processing"
-
-            # Start background classification
-            background_tasks.add_task(
-                classify_document_task, content, task_id, validated_filename
-            )
+            documents.append((content, task_id, validated_filename))
 
             successful_uploads += 1
 
         except Exception as e:
             errors.append({"filename": file.filename, "error": str(e)})
 
+    # Start background classification for the whole batch
+    if documents:
+        background_tasks.add_task(classify_documents_task, documents)
+
     return {
         "batch_id": batch_id,
         "task_ids": task_ids,
@@ -457,10 +533,9 @@ async def batch_evaluation_test(
         Dict[str, Any]: Batch evaluation response.
     """
     try:
-        # Parse labels
-        import json
+        # Parse labels; orjson's decode error subclasses json.JSONDecodeError
         try:
-            ground_truth = json.loads(labels) if labels else {}
+            ground_truth = json_loads(labels) if labels else {}
         except json.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid labels JSON format")
         
@@ -472,6 +547,7 @@ async def batch_evaluation_test(
         
         evaluation_id = str(uuid.uuid4())
         task_ids = []
+        documents = []
         successful_uploads = 0
         errors = []
         
@@ -489,17 +565,17 @@ async def batch_evaluation_test(
                 # Initialize task tracking
                 task_status[task_id] = ProcessingStatus.QUEUED.value
                 task_progress[task_id] = f"Evaluation {evaluation_id}: Queued for processing"
-                
-                # Start background classification
-                background_tasks.add_task(
-                    classify_document_task, content, task_id, validated_filename
-                )
+                documents.append((content, task_id, validated_filename))
                 
                 successful_uploads += 1
                 
             except Exception as e:
                 errors.append({"filename": file.filename, "error": str(e)})
         
+        # Start background classification for the whole batch
+        if documents:
+            background_tasks.add_task(classify_documents_task, documents)
+        
         # Store evaluation metadata
         evaluation_results[evaluation_id] = {
             "evaluation_id": evaluation_id,
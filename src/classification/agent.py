@@ -10,8 +10,8 @@ import logging
 from typing import Dict, Any
 from datetime import datetime
 
-from .tools import TextractClient, BedrockClient
-from .offline_classifier import create_offline_classification_result
+from .tools import TextractClient, BedrockClient, close_aws_clients
+from .offline_classifier import _offline_classifier, create_offline_classification_result
 from ..api.models import DocumentType, ProcessingStatus
 from ..utils.config import settings
 
@@ -30,6 +30,9 @@ class DocumentClassificationAgent:
         """Initialize the classification agent with AWS clients."""
         self.textract_client = TextractClient()
         self.bedrock_client = BedrockClient()
+        # Shared with create_offline_classification_result, so both paths
+        # use one result cache
+        self.offline_classifier = _offline_classifier
         self.document_types = [doc_type.value for doc_type in DocumentType]
         self.confidence_threshold = settings.CONFIDENCE_THRESHOLD
 
@@ -48,7 +51,7 @@ class DocumentClassificationAgent:
         Returns:
             Dict[str, Any]: Complete classification result with metadata.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             logger.info(
@@ -61,7 +64,7 @@ class DocumentClassificationAgent:
 
             if not extracted_text or len(extracted_text.strip()) < 10:
                 logger.warning(f"Insufficient text extracted from {filename} - using offline classification")
-                processing_time = time.time() - start_time
+                processing_time = time.perf_counter() - start_time
                 return create_offline_classification_result(
                     extracted_text or "",
                     filename,
@@ -80,10 +83,10 @@ class DocumentClassificationAgent:
                 classification_result,
                 extracted_text,
                 filename,
-                time.time() - start_time,
+                time.perf_counter() - start_time,
             )
 
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             logger.info(
                 f"Classification completed for {filename} in {processing_time:.2f}s: "
                 f"{final_result['classification']['category']} "
@@ -93,7 +96,7 @@ class DocumentClassificationAgent:
             return final_result
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             logger.error(f"Classification failed for {filename}: {str(e)} - using offline fallback")
             
             # Try offline fallback as last resort
@@ -193,11 +196,8 @@ class DocumentClassificationAgent:
             logger.info(f"Bedrock failed ({str(e)}), using offline classification fallback...")
             
             # Fallback to offline classifier
-            from .offline_classifier import OfflineClassifier
-            
             try:
-                offline_classifier = OfflineClassifier()
-                offline_result = offline_classifier.classify_text(text)
+                offline_result = self.offline_classifier.classify_text(text)._asdict()
                 
                 # Ensure valid category from offline classifier
                 if offline_result["category"] not in self.document_types and offline_result["category"] != "Unknown":
@@ -341,6 +341,10 @@ class DocumentClassificationAgent:
 
         return health_status
 
+    async def close(self) -> None:
+        """Close the shared AWS clients used by the agent."""
+        await close_aws_clients()
+
     def get_supported_document_types(self) -> list:
         """
         Get list of supported document types.
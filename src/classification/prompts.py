@@ -5,15 +5,17 @@ This module contains carefully crafted prompts with few-shot examples
 for accurate document type classification using AWS Bedrock.
 """
 
+from bisect import bisect_right
+
 # Document types for classification
-DOCUMENT_TYPES = [
+DOCUMENT_TYPES = (
     "Government ID",
     "Payslip",
     "Bank Statement",
     "Employment Letter",
     "Utility Bill",
     "Savings Statement",
-]
+)
 
 # Main classification prompt template with few-shot examples
 CLASSIFICATION_PROMPT_TEMPLATE = """
@@ -79,6 +81,44 @@ Respond in JSON format:
 
 Classification:"""
 
+# Prompt template for classifying several documents in one request
+BATCH_CLASSIFICATION_PROMPT_TEMPLATE = """
+You are an expert document classifier for home loan applications. Your task is to analyze the text of each numbered document below and classify it into one of these categories:
+
+- Government ID (Driver's License, Passport, National ID)
+- Payslip (Income statements, pay stubs, salary slips)
+- Bank Statement (Account statements, transaction records)
+- Employment Letter (Job verification, employment confirmation)
+- Utility Bill (Electric, gas, water, internet, phone bills)
+- Savings Statement (Investment accounts, savings records, retirement accounts)
+
+{documents}
+
+Instructions:
+1. Classify each document independently of the others
+2. Match patterns and terminology to the appropriate document type
+3. If a document contains mixed content, classify based on its primary purpose
+4. Provide a confidence score between 0.0 and 1.0 for each document
+5. Include brief reasoning for each classification
+
+Respond with a JSON array containing exactly one object per document, using the document number as "index":
+[
+    {{
+        "index": 1,
+        "category": "document_type",
+        "confidence": 0.95,
+        "reasoning": "Brief explanation of classification decision"
+    }}
+]
+
+Classification:"""
+
+# Section template for one document within the batch prompt
+BATCH_DOCUMENT_TEMPLATE = """DOCUMENT {index}:
+<text>
+{extracted_text}
+</text>"""
+
 # Prompt for handling unclear or ambiguous documents
 AMBIGUOUS_DOCUMENT_PROMPT = """
 The document text provided does not clearly match any of the standard home loan document categories. 
@@ -95,7 +135,7 @@ If unsure, classify as "Unknown" with low confidence and explain why the documen
 """
 
 # Prompt templates for specific document types (for fine-tuning)
-GOVERNMENT_ID_INDICATORS = [
+GOVERNMENT_ID_INDICATORS = (
     "license number",
     "driver license",
     "passport",
@@ -105,9 +145,9 @@ GOVERNMENT_ID_INDICATORS = [
     "issued",
     "state id",
     "identification",
-]
+)
 
-PAYSLIP_INDICATORS = [
+PAYSLIP_INDICATORS = (
     "pay period",
     "gross pay",
     "net pay",
@@ -119,9 +159,9 @@ PAYSLIP_INDICATORS = [
     "payroll",
     "pay stub",
     "earnings",
-]
+)
 
-BANK_STATEMENT_INDICATORS = [
+BANK_STATEMENT_INDICATORS = (
     "account number",
     "statement period",
     "balance",
@@ -130,9 +170,9 @@ BANK_STATEMENT_INDICATORS = [
     "withdrawal",
     "checking",
     "savings account statement",
-]
+)
 
-EMPLOYMENT_LETTER_INDICATORS = [
+EMPLOYMENT_LETTER_INDICATORS = (
     "employment verification",
     "employed with",
     "job title",
@@ -141,9 +181,9 @@ EMPLOYMENT_LETTER_INDICATORS = [
     "start date",
     "employment status",
     "hr department",
-]
+)
 
-UTILITY_BILL_INDICATORS = [
+UTILITY_BILL_INDICATORS = (
     "electric",
     "gas",
     "water",
@@ -155,9 +195,9 @@ UTILITY_BILL_INDICATORS = [
     "amount due",
     "kwh",
     "usage",
-]
+)
 
-SAVINGS_STATEMENT_INDICATORS = [
+SAVINGS_STATEMENT_INDICATORS = (
     "savings account",
     "investment",
     "retirement",
@@ -168,7 +208,27 @@ SAVINGS_STATEMENT_INDICATORS = [
     "dividend",
     "portfolio",
     "mutual fund",
-]
+)
+
+# Indicator lookup by document category
+_INDICATORS_MAP = {
+    "Government ID": GOVERNMENT_ID_INDICATORS,
+    "Payslip": PAYSLIP_INDICATORS,
+    "Bank Statement": BANK_STATEMENT_INDICATORS,
+    "Employment Letter": EMPLOYMENT_LETTER_INDICATORS,
+    "Utility Bill": UTILITY_BILL_INDICATORS,
+    "Savings Statement": SAVINGS_STATEMENT_INDICATORS,
+}
+
+# Confidence explanation bands: a score at or above _CONFIDENCE_THRESHOLDS[i]
+# uses _CONFIDENCE_EXPLANATIONS[i + 1]
+_CONFIDENCE_THRESHOLDS = (0.5, 0.7, 0.9)
+_CONFIDENCE_EXPLANATIONS = (
+    "Low confidence - ambiguous or unclear {category} classification",
+    "Moderate confidence - some {category} features detected",
+    "Good confidence - most {category} characteristics identified",
+    "High confidence - clear {category} indicators present",
+)
 
 
 def build_confidence_explanation(category: str, confidence: float) -> str:
@@ -182,17 +242,11 @@ def build_confidence_explanation(category: str, confidence: float) -> str:
     Returns:
         str: Explanation of confidence level.
     """
-    if confidence >= 0.9:
-        return f"High confidence - clear {category} indicators present"
-    elif confidence >= 0.7:
-        return f"Good confidence - most {category} characteristics identified"
-    elif confidence >= 0.5:
-        return f"Moderate confidence - some {category} features detected"
-    else:
-        return f"Low confidence - ambiguous or unclear {category} classification"
+    band = bisect_right(_CONFIDENCE_THRESHOLDS, confidence)
+    return _CONFIDENCE_EXPLANATIONS[band].format(category=category)
 
 
-def get_document_indicators(category: str) -> list:
+def get_document_indicators(category: str) -> tuple:
     """
     Get keyword indicators for a specific document category.
 
@@ -200,15 +254,6 @@ def get_document_indicators(category: str) -> list:
         category: Document category name.
 
     Returns:
-        list: List of indicator keywords.
+        tuple: Indicator keywords (empty for unknown categories).
     """
-    indicators_map = {
-        "Government ID": GOVERNMENT_ID_INDICATORS,
-        "Payslip": PAYSLIP_INDICATORS,
-        "Bank Statement": BANK_STATEMENT_INDICATORS,
-        "Employment Letter": EMPLOYMENT_LETTER_INDICATORS,
-        "Utility Bill": UTILITY_BILL_INDICATORS,
-        "Savings Statement": SAVINGS_STATEMENT_INDICATORS,
-    }
-
-    return indicators_map.get(category, [])
+    return _INDICATORS_MAP.get(category, ())
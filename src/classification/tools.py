@@ -5,18 +5,140 @@ This module provides client classes for AWS Textract and Bedrock services
 with proper error handling, retry logic, and response parsing.
 """
 
+import io
+import re
 import json
-import boto3
 import asyncio
-from typing import Dict, Any
+import traceback
+import uuid
+import hashlib
+import aioboto3
+from collections import OrderedDict
+from contextlib import AsyncExitStack, closing
+from functools import lru_cache
+from typing import Dict, Any, BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+from botocore.config import Config
 from botocore.exceptions import ClientError
 # Removed textractcaller dependency - using direct boto3 response parsing
 import logging
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Fallback extraction uses pypdf only without it
+    pdfium = None
+
+try:
+    import pypdf
+except ImportError:  # pypdf fallback extraction is unavailable without it
+    pypdf = None
+
+from ..api.models import DocumentType
 from ..utils.config import settings
+from ..utils.json_utils import json_dumps, json_loads
+from .prompts import (
+    BATCH_CLASSIFICATION_PROMPT_TEMPLATE,
+    BATCH_DOCUMENT_TEMPLATE,
+    CLASSIFICATION_PROMPT_TEMPLATE,
+)
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Parses the JSON value embedded in a model completion, ignoring any
+# trailing prose. JSONDecoder instances are stateless and safe to share.
+_JSON_DECODER = json.JSONDecoder()
+
+# The single-document prompt has one placeholder, so it is rendered once
+# around a sentinel and assembled by concatenation on each request
+_CLASSIFICATION_PROMPT_PREFIX, _, _CLASSIFICATION_PROMPT_SUFFIX = (
+    CLASSIFICATION_PROMPT_TEMPLATE.format(extracted_text="\0").partition("\0")
+)
+
+# "field: value" lines in a non-JSON completion, tolerating leading quotes
+# or bullets, trailing commas and CRLF line endings
+_RESPONSE_FIELD_RE = re.compile(
+    r"^[^\w\n]*(category|confidence|reasoning)[^\w\n:]*:[ \t]*(.*?)[ \t,\r]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Connection pool and retry settings shared by all AWS clients. Adaptive
+# mode rate-limits on the client side and retries throttling, transient
+# connection errors and 5xx responses with jittered exponential backoff.
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Synchronous Textract calls accept documents up to 5 MB; larger PDFs are
+# staged in S3 and processed with an asynchronous text detection job
+TEXTRACT_SYNC_MAX_BYTES = 4_500_000
+TEXTRACT_JOB_TIMEOUT = 300  # seconds
+
+# Recent Bedrock classifications keyed by hash of model ID and prompt text
+CLASSIFICATION_CACHE_SIZE = 1024
+_classification_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+# Only results naming one of these were parsed successfully and are cached;
+# "Unknown" and parse failures are retried against the model next time
+_CACHEABLE_CATEGORIES = frozenset(
+    doc_type.value for doc_type in DocumentType if doc_type is not DocumentType.UNKNOWN
+)
+
+# Open AWS clients keyed by (service, region), reused across instances
+_aws_clients: Dict[Tuple[str, str], Any] = {}
+_aws_client_stack = AsyncExitStack()
+
+
+@lru_cache(maxsize=None)
+def _get_aws_session() -> aioboto3.Session:
+    """
+    Get the shared aioboto3 session.
+
+    Explicit credentials from settings are used when configured; otherwise
+    the default AWS credential chain applies.
+
+    Returns:
+        aioboto3.Session: Shared session.
+    """
+    return aioboto3.Session(
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
+    )
+
+
+async def get_aws_client(service_name: str, region_name: str):
+    """
+    Get a shared async AWS client, opening it on first use.
+
+    Service models are loaded and the connection pool is created once per
+    (service, region), so later calls reuse keep-alive connections.
+
+    Args:
+        service_name: AWS service name (e.g. "textract").
+        region_name: AWS region.
+
+    Returns:
+        Async AWS client for the service.
+    """
+    key = (service_name, region_name)
+    client = _aws_clients.get(key)
+    if client is None:
+        client = await _aws_client_stack.enter_async_context(
+            _get_aws_session().client(
+                service_name, region_name=region_name, config=AWS_CLIENT_CONFIG
+            )
+        )
+        _aws_clients[key] = client
+    return client
+
+
+async def close_aws_clients() -> None:
+    """Close all shared AWS clients."""
+    await _aws_client_stack.aclose()
+    _aws_clients.clear()
+
 
 class TextractClient:
     """
@@ -26,15 +148,31 @@ class TextractClient:
     with confidence scoring and error handling.
     """
 
-    def __init__(self):
-        """Initialize Textract client with AWS credentials."""
-        self.client = boto3.client(
-            "textract",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+    def __init__(self, max_chars: Optional[int] = None):
+        """
+        Initialize Textract client configuration.
+
+        Args:
+            max_chars: Characters the PDF fallback collects before it stops
+                reading pages. Defaults to settings.FALLBACK_MAX_TEXT_LENGTH.
+        """
+        self.region_name = settings.AWS_REGION
         self.confidence_threshold = settings.TEXTRACT_CONFIDENCE_THRESHOLD
+        # Block confidence cutoff on Textract's 0-100 scale
+        self.min_block_confidence = self.confidence_threshold * 100
+        self.fallback_max_chars = (
+            max_chars if max_chars is not None else settings.FALLBACK_MAX_TEXT_LENGTH
+        )
+        self._semaphore = asyncio.Semaphore(settings.TEXTRACT_MAX_CONCURRENCY)
+
+    async def _get_client(self):
+        """
+        Get the shared async Textract client.
+
+        Returns:
+            Async Textract client.
+        """
+        return await get_aws_client("textract", self.region_name)
 
     async def extract_text(self, pdf_bytes: bytes) -> str:
         """
@@ -49,31 +187,40 @@ class TextractClient:
         Raises:
             Exception: If text extraction fails.
         """
+        # In-memory stream for the PDF fallback. BytesIO shares the bytes
+        # buffer until written, so this does not copy the PDF.
+        pdf_stream = io.BytesIO(pdf_bytes)
+
         try:
-            # Try simple text detection first (more compatible)
-            loop = asyncio.get_event_loop()
-            try:
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.client.detect_document_text(
-                        Document={"Bytes": pdf_bytes}
-                    ),
-                )
-            except ClientError as e:
-                if e.response["Error"]["Code"] == "UnsupportedDocumentException":
-                    # Fallback to analyze_document without advanced features
-                    logger.warning("Falling back to analyze_document due to format issues")
-                    response = await loop.run_in_executor(
-                        None,
-                        lambda: self.client.analyze_document(
-                            Document={"Bytes": pdf_bytes}, FeatureTypes=[]
-                        ),
-                    )
-                else:
-                    raise
+            client = await self._get_client()
+
+            if len(pdf_bytes) > TEXTRACT_SYNC_MAX_BYTES and settings.TEXTRACT_TEMP_BUCKET:
+                # Too large for synchronous calls - use an async S3 job, which
+                # takes the request semaphore per call rather than per job
+                blocks = await self._detect_text_via_s3(client, pdf_bytes)
+            else:
+                # Limit in-flight Textract requests to avoid throttling
+                async with self._semaphore:
+                    # Try simple text detection first (more compatible). The
+                    # bytes are passed through as-is: botocore's blob validation
+                    # rejects memoryview, and no executor closure retains them.
+                    try:
+                        response = await client.detect_document_text(
+                            Document={"Bytes": pdf_bytes}
+                        )
+                    except ClientError as e:
+                        if e.response["Error"]["Code"] == "UnsupportedDocumentException":
+                            # Fallback to analyze_document without advanced features
+                            logger.warning("Falling back to analyze_document due to format issues")
+                            response = await client.analyze_document(
+                                Document={"Bytes": pdf_bytes}, FeatureTypes=[]
+                            )
+                        else:
+                            raise
+                blocks = response.get("Blocks", [])
 
-            # Parse response and extract text directly
-            text_content = self._extract_text_from_response(response)
+            # Parse blocks and extract text directly
+            text_content = self._extract_text_from_blocks(blocks)
 
             logger.info(f"Successfully extracted text: {len(text_content)} characters")
             return text_content
@@ -82,11 +229,12 @@ class TextractClient:
             error_code = e.response["Error"]["Code"]
             logger.error(f"AWS Textract error {error_code}: {e}")
             
-            # Try fallback text extraction using pypdf for various AWS errors
+            # Try fallback text extraction using the local PDF extractors for various AWS errors.
+            # Throttling is left out: botocore has already retried it, and the
+            # local extractors would silently degrade text quality.
             aws_fallback_errors = [
                 "UnsupportedDocumentException", 
                 "InvalidParameterException", 
-                "ThrottlingException",
                 "InvalidSignatureException",  # Missing AWS credentials
                 "UnauthorizedOperation",      # Invalid credentials
                 "AccessDeniedException",      # No permission
@@ -96,7 +244,7 @@ class TextractClient:
             if error_code in aws_fallback_errors:
                 logger.info(f"Attempting fallback PDF text extraction due to {error_code}...")
                 try:
-                    fallback_text = self._extract_text_fallback(pdf_bytes)
+                    fallback_text = self._extract_text_fallback(pdf_stream)
                     if fallback_text and len(fallback_text.strip()) > 10:
                         logger.info(f"Fallback extraction successful: {len(fallback_text)} characters")
                         return fallback_text
@@ -110,131 +258,351 @@ class TextractClient:
             logger.error(f"Text extraction error: {e}")
             raise Exception(f"Failed to extract text: {str(e)}")
 
-    def _extract_text_from_response(self, response: Dict[str, Any]) -> str:
+    async def _detect_text_via_s3(self, client, pdf_bytes: bytes) -> List[Dict[str, Any]]:
+        """
+        Detect text in a large PDF with an asynchronous Textract job.
+
+        The PDF is uploaded to settings.TEXTRACT_TEMP_BUCKET, processed with
+        start_document_text_detection, and deleted once the job finishes.
+        The request semaphore is held for each API call only, never while
+        waiting between polls, so long jobs do not block other requests.
+
+        Args:
+            client: Async Textract client.
+            pdf_bytes: PDF file content.
+
+        Returns:
+            List[Dict[str, Any]]: Blocks from all result pages.
+
+        Raises:
+            Exception: If the job fails or does not finish in time.
+        """
+        bucket = settings.TEXTRACT_TEMP_BUCKET
+        key = f"textract-staging/{uuid.uuid4().hex}.pdf"
+        s3_client = await get_aws_client("s3", self.region_name)
+
+        logger.info(f"Staging {len(pdf_bytes)} byte PDF for async Textract: s3://{bucket}/{key}")
+        async with self._semaphore:
+            await s3_client.put_object(Bucket=bucket, Key=key, Body=pdf_bytes)
+
+        try:
+            async with self._semaphore:
+                job = await client.start_document_text_detection(
+                    DocumentLocation={"S3Object": {"Bucket": bucket, "Name": key}}
+                )
+            job_id = job["JobId"]
+
+            # Poll with exponential backoff until the job completes
+            delay = 0.5
+            waited = 0.0
+            while True:
+                async with self._semaphore:
+                    response = await client.get_document_text_detection(JobId=job_id)
+                job_status = response["JobStatus"]
+                if job_status != "IN_PROGRESS":
+                    break
+                if waited >= TEXTRACT_JOB_TIMEOUT:
+                    raise Exception(f"Textract job {job_id} timed out after {waited:.0f}s")
+                await asyncio.sleep(delay)
+                waited += delay
+                delay = min(delay * 2, 5.0)
+
+            if job_status == "FAILED":
+                raise Exception(
+                    f"Textract job {job_id} failed: {response.get('StatusMessage', 'unknown error')}"
+                )
+
+            blocks = await self._collect_job_blocks(client, job_id, response)
+
+            logger.info(f"Textract job {job_id} completed with {len(blocks)} blocks")
+            return blocks
+
+        finally:
+            try:
+                await s3_client.delete_object(Bucket=bucket, Key=key)
+            except Exception as e:
+                logger.warning(f"Failed to delete staged PDF s3://{bucket}/{key}: {e}")
+
+    async def _collect_job_blocks(
+        self, client, job_id: str, response: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect blocks from every result page of a text detection job.
+
+        Textract returns at most 1000 blocks per page and sets NextToken
+        while more pages remain.
+
+        Args:
+            client: Async Textract client.
+            job_id: Text detection job ID.
+            response: First get_document_text_detection response.
+
+        Returns:
+            List[Dict[str, Any]]: Blocks from all pages in order.
+        """
+        blocks = list(response.get("Blocks", []))
+        while "NextToken" in response:
+            async with self._semaphore:
+                response = await client.get_document_text_detection(
+                    JobId=job_id, NextToken=response["NextToken"]
+                )
+            blocks.extend(response.get("Blocks", []))
+        return blocks
+
+    def _extract_text_from_blocks(self, blocks: Iterable[Dict[str, Any]]) -> str:
         """
-        Extract text content from raw Textract response.
+        Extract text content from Textract blocks.
 
         Args:
-            response: Raw Textract response.
+            blocks: Blocks from one or more Textract response pages.
 
         Returns:
             str: Combined text content from all blocks.
         """
+        min_confidence = self.min_block_confidence
+
+        # Group blocks by type in a single pass. Only WORD texts are indexed
+        # by ID since they are all that key/value resolution reads.
+        word_texts = {}
         text_blocks = []
+        word_blocks = []
+        key_blocks = []
+        value_blocks = {}
 
-        # Extract text from LINE blocks with confidence filtering
-        for block in response.get("Blocks", []):
-            if block["BlockType"] == "LINE":
-                confidence = block.get("Confidence", 0)
-                if confidence >= self.confidence_threshold * 100:  # Textract uses 0-100 scale
+        for block in blocks:
+            block_type = block["BlockType"]
+
+            if block_type == "LINE":
+                # Extract text from LINE blocks with confidence filtering
+                if block.get("Confidence", 0) >= min_confidence:
                     text_blocks.append(block.get("Text", ""))
+            elif block_type == "WORD":
+                text = block.get("Text", "")
+                word_texts[block["Id"]] = text
+                if block.get("Confidence", 0) >= min_confidence:
+                    word_blocks.append(text)
+            elif block_type == "KEY_VALUE_SET":
+                # Collect form data (key-value pairs) if available
+                entity_types = block.get("EntityTypes", ())
+                if "KEY" in entity_types:
+                    key_blocks.append(block)
+                elif "VALUE" in entity_types:
+                    value_blocks[block["Id"]] = block
 
-        # If no LINE blocks found or very little text, try WORD blocks
+        # If no LINE blocks found or very little text, use WORD blocks
         if len(text_blocks) == 0 or len("\n".join(text_blocks).strip()) < 10:
-            word_blocks = []
-            for block in response.get("Blocks", []):
-                if block["BlockType"] == "WORD":
-                    confidence = block.get("Confidence", 0)
-                    if confidence >= self.confidence_threshold * 100:
-                        word_blocks.append(block.get("Text", ""))
-            
             if word_blocks:
                 # Join words with spaces and create lines
                 text_blocks = [" ".join(word_blocks)]
 
-        # Try to extract form data (key-value pairs) if available
-        key_blocks = {}
-        value_blocks = {}
-        
-        for block in response.get("Blocks", []):
-            if block["BlockType"] == "KEY_VALUE_SET":
-                if "KEY" in block.get("EntityTypes", []):
-                    key_blocks[block["Id"]] = block
-                elif "VALUE" in block.get("EntityTypes", []):
-                    value_blocks[block["Id"]] = block
-
         # Match keys with values
-        for key_id, key_block in key_blocks.items():
-            if "Relationships" in key_block:
-                for relationship in key_block["Relationships"]:
-                    if relationship["Type"] == "VALUE":
-                        for value_id in relationship["Ids"]:
-                            if value_id in value_blocks:
-                                key_text = self._get_text_from_block(key_block, response)
-                                value_text = self._get_text_from_block(value_blocks[value_id], response)
-                                if key_text and value_text:
-                                    text_blocks.append(f"{key_text}: {value_text}")
+        for key_block in key_blocks:
+            key_text = None
+            for relationship in key_block.get("Relationships", ()):
+                if relationship["Type"] == "VALUE":
+                    for value_id in relationship["Ids"]:
+                        value_block = value_blocks.get(value_id)
+                        if value_block is None:
+                            continue
+                        if key_text is None:
+                            key_text = self._get_text_from_block(key_block, word_texts)
+                        value_text = self._get_text_from_block(value_block, word_texts)
+                        if key_text and value_text:
+                            text_blocks.append(f"{key_text}: {value_text}")
 
         return "\n".join(text_blocks)
 
-    def _get_text_from_block(self, block: Dict[str, Any], response: Dict[str, Any]) -> str:
+    def _get_text_from_block(self, block: Dict[str, Any], word_texts: Dict[str, str]) -> str:
         """
         Get text from a block by following child relationships.
         
         Args:
             block: Block to extract text from.
-            response: Full Textract response.
+            word_texts: Text of every WORD block, indexed by block ID.
             
         Returns:
             str: Extracted text.
         """
         text_parts = []
         
-        if "Relationships" in block:
-            for relationship in block["Relationships"]:
-                if relationship["Type"] == "CHILD":
-                    for child_id in relationship["Ids"]:
-                        # Find child block
-                        for child_block in response.get("Blocks", []):
-                            if child_block["Id"] == child_id and child_block["BlockType"] == "WORD":
-                                text_parts.append(child_block.get("Text", ""))
+        for relationship in block.get("Relationships", ()):
+            if relationship["Type"] == "CHILD":
+                for child_id in relationship["Ids"]:
+                    child_text = word_texts.get(child_id)
+                    if child_text is not None:
+                        text_parts.append(child_text)
         
         return " ".join(text_parts)
 
-    def _extract_text_fallback(self, pdf_bytes: bytes) -> str:
+    def _clean_page_text(self, page_num: int, page_text: Optional[str]) -> Optional[str]:
         """
-        Fallback text extraction using pypdf when Textract fails.
-        
+        Normalize the extracted text of one page.
+
         Args:
-            pdf_bytes: PDF file content.
-            
+            page_num: Zero-based page index, used for logging.
+            page_text: Raw text returned by the PDF library.
+
         Returns:
-            str: Extracted text.
+            Optional[str]: Cleaned text, or None if the page has no substantial content.
+        """
+        logger.info(f"Page {page_num + 1}: extracted {len(page_text) if page_text else 0} characters")
+
+        if not page_text or not page_text.strip():
+            logger.warning(f"Page {page_num + 1} returned no text")
+            return None
+
+        # Clean up the text and remove excessive whitespace
+        cleaned_text = _WHITESPACE_RE.sub(" ", page_text.strip())
+
+        if len(cleaned_text) > 5:  # Only add if substantial text
+            logger.info(f"Added text from page {page_num + 1}: '{cleaned_text[:50]}...'")
+            return cleaned_text
+
+        logger.warning(f"Page {page_num + 1} has insufficient text: '{cleaned_text}'")
+        return None
+
+    def _iter_page_texts_pdfium(self, pdf_stream: BinaryIO) -> Iterator[str]:
+        """
+        Yield cleaned text for each PDF page using PDFium.
+
+        PDFium objects hold native handles, so every page, text page and the
+        document itself are closed explicitly rather than left to the GC.
+
+        Args:
+            pdf_stream: Seekable binary stream of the PDF content.
+
+        Yields:
+            str: Whitespace-normalized text of one page.
         """
+        pdf_stream.seek(0)
+        pdf = pdfium.PdfDocument(pdf_stream)
         try:
-            import io
-            import pypdf
-            
-            logger.info("Starting pypdf fallback text extraction...")
-            pdf_reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
-            text_blocks = []
-            
-            logger.info(f"PDF has {len(pdf_reader.pages)} pages")
-            
-            for page_num, page in enumerate(pdf_reader.pages):
+            logger.info(f"PDF has {len(pdf)} pages")
+
+            for page_num in range(len(pdf)):
+                page = pdf[page_num]
                 try:
-                    page_text = page.extract_text()
-                    logger.info(f"Page {page_num + 1}: extracted {len(page_text) if page_text else 0} characters")
-                    
-                    if page_text and page_text.strip():
-                        # Clean up the text
-                        cleaned_text = page_text.strip().replace('\n', ' ').replace('\r', ' ')
-                        # Remove excessive whitespace
-                        import re
-                        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-                        
-                        if len(cleaned_text) > 5:  # Only add if substantial text
-                            text_blocks.append(cleaned_text)
-                            logger.info(f"Added text from page {page_num + 1}: '{cleaned_text[:50]}...'")
-                        else:
-                            logger.warning(f"Page {page_num + 1} has insufficient text: '{cleaned_text}'")
-                    else:
-                        logger.warning(f"Page {page_num + 1} returned no text")
+                    textpage = page.get_textpage()
+                    try:
+                        page_text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
                 except Exception as e:
                     logger.warning(f"Could not extract text from page {page_num + 1}: {e}")
                     continue
-            
-            combined_text = "\n".join(text_blocks)
+                finally:
+                    page.close()
+
+                cleaned_text = self._clean_page_text(page_num, page_text)
+                if cleaned_text:
+                    yield cleaned_text
+        finally:
+            pdf.close()
+
+    def _iter_page_texts_pypdf(self, pdf_stream: BinaryIO) -> Iterator[str]:
+        """
+        Yield cleaned text for each PDF page using pypdf.
+
+        Pages are extracted lazily, so callers that stop early never pay
+        for parsing the remaining pages.
+
+        Args:
+            pdf_stream: Seekable binary stream of the PDF content.
+
+        Yields:
+            str: Whitespace-normalized text of one page.
+        """
+        # Non-strict parsing tolerates minor xref issues without revalidating
+        pdf_stream.seek(0)
+        pdf_reader = pypdf.PdfReader(pdf_stream, strict=False)
+
+        logger.info(f"PDF has {len(pdf_reader.pages)} pages")
+
+        for page_num, page in enumerate(pdf_reader.pages):
+            try:
+                page_text = page.extract_text()
+            except Exception as e:
+                logger.warning(f"Could not extract text from page {page_num + 1}: {e}")
+                continue
+
+            cleaned_text = self._clean_page_text(page_num, page_text)
+            if cleaned_text:
+                yield cleaned_text
+
+    def _collect_page_texts(self, page_texts: Iterator[str]) -> str:
+        """
+        Join page texts until enough text has been collected for classification.
+
+        Args:
+            page_texts: Iterator of cleaned page texts.
+
+        Returns:
+            str: Combined text of the pages read.
+        """
+        text_blocks = []
+        total_chars = 0
+
+        # closing() releases the extractor's resources as soon as we stop early
+        with closing(page_texts):
+            for cleaned_text in page_texts:
+                text_blocks.append(cleaned_text)
+                total_chars += len(cleaned_text) + 1  # Include joining newline
+                if total_chars >= self.fallback_max_chars:
+                    logger.info(
+                        f"Collected {total_chars} characters, skipping remaining pages"
+                    )
+                    break
+
+        return "\n".join(text_blocks)
+
+    def _extract_text_fallback(self, pdf: Union[bytes, BinaryIO]) -> str:
+        """
+        Fallback text extraction when Textract fails.
+
+        Uses pypdfium2 when available and falls back to pypdf if it is not
+        installed or cannot read the document.
+
+        Args:
+            pdf: PDF file content, or a seekable binary stream of it.
+
+        Returns:
+            str: Extracted text.
+        """
+        pdf_stream = io.BytesIO(pdf) if isinstance(pdf, (bytes, bytearray)) else pdf
+
+        if pdfium is not None:
+            try:
+                logger.info("Starting pypdfium2 fallback text extraction...")
+                combined_text = self._collect_page_texts(self._iter_page_texts_pdfium(pdf_stream))
+                logger.info(f"pypdfium2 fallback completed: {len(combined_text)} total characters")
+
+                if combined_text.strip():
+                    return combined_text
+                logger.error("pypdfium2 fallback returned empty text")
+                return ""
+
+            except Exception as e:
+                logger.warning(f"pypdfium2 fallback failed, retrying with pypdf: {e}")
+
+        return self._extract_text_fallback_pypdf(pdf_stream)
+
+    def _extract_text_fallback_pypdf(self, pdf_stream: BinaryIO) -> str:
+        """
+        Fallback text extraction using pypdf.
+
+        Args:
+            pdf_stream: Seekable binary stream of the PDF content.
+
+        Returns:
+            str: Extracted text.
+        """
+        if pypdf is None:
+            logger.error("pypdf is not installed, fallback text extraction unavailable")
+            return ""
+
+        try:
+            logger.info("Starting pypdf fallback text extraction...")
+            combined_text = self._collect_page_texts(self._iter_page_texts_pypdf(pdf_stream))
             logger.info(f"pypdf fallback completed: {len(combined_text)} total characters")
             
             if combined_text.strip():
@@ -245,8 +613,8 @@ class TextractClient:
             
         except Exception as e:
             logger.error(f"pypdf fallback failed completely: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Traceback: {traceback.format_exc()}")
             return ""
 
 
@@ -259,14 +627,20 @@ class BedrockClient:
     """
 
     def __init__(self):
-        """Initialize Bedrock client with AWS credentials."""
-        self.client = boto3.client(
-            "bedrock-runtime",
-            region_name=settings.BEDROCK_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+        """Initialize Bedrock client configuration."""
+        self.region_name = settings.BEDROCK_REGION
         self.model_id = settings.BEDROCK_MODEL_ID
+        self.max_text_length = settings.BEDROCK_MAX_TEXT_LENGTH
+        self._semaphore = asyncio.Semaphore(settings.BEDROCK_MAX_CONCURRENCY)
+
+    async def _get_client(self):
+        """
+        Get the shared async Bedrock runtime client.
+
+        Returns:
+            Async Bedrock runtime client.
+        """
+        return await get_aws_client("bedrock-runtime", self.region_name)
 
     async def classify_document(self, text: str) -> Dict[str, Any]:
         """
@@ -282,36 +656,21 @@ class BedrockClient:
             Exception: If classification fails.
         """
         try:
+            # Reuse the previous result when the same text is reclassified
+            cache_key = self._classification_cache_key(text)
+            cached_result = _classification_cache.get(cache_key)
+            if cached_result is not None:
+                _classification_cache.move_to_end(cache_key)
+                logger.info(
+                    f"Classification cache hit: {cached_result['category']} "
+                    f"(confidence: {cached_result['confidence']})"
+                )
+                return dict(cached_result)
+
             # Build classification prompt
             prompt = self._build_classification_prompt(text)
 
-            # Prepare request body for Claude 3.5 Sonnet
-            request_body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 300,
-                "temperature": 0.2,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            }
-
-            # Make async API call
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.invoke_model(
-                    modelId=self.model_id,
-                    body=json.dumps(request_body),
-                    contentType="application/json",
-                    accept="application/json",
-                ),
-            )
-
-            # Parse response
-            response_body = json.loads(response["body"].read())
+            response_body = await self._invoke_model(prompt, max_tokens=300)
             classification_result = self._parse_classification_response(response_body)
 
             logger.info(
@@ -319,6 +678,11 @@ class BedrockClient:
                 f"(confidence: {classification_result['confidence']})"
             )
 
+            if classification_result["category"] in _CACHEABLE_CATEGORIES:
+                _classification_cache[cache_key] = dict(classification_result)
+                if len(_classification_cache) > CLASSIFICATION_CACHE_SIZE:
+                    _classification_cache.popitem(last=False)
+
             return classification_result
 
         except ClientError as e:
@@ -329,6 +693,138 @@ class BedrockClient:
             logger.error(f"Classification error: {e}")
             raise Exception(f"Failed to classify document: {str(e)}")
 
+    async def classify_documents(
+        self, texts: List[str], batch_size: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify several documents, packing up to batch_size per Bedrock call.
+
+        Args:
+            texts: Extracted text for each document.
+            batch_size: Maximum number of documents per model invocation.
+
+        Returns:
+            List[Dict[str, Any]]: Classification results in the same order as texts.
+
+        Raises:
+            Exception: If classification fails.
+        """
+        results = []
+
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+
+            # A single document uses the few-shot prompt
+            if len(batch) == 1:
+                results.append(await self.classify_document(batch[0]))
+                continue
+
+            try:
+                prompt = self._build_batch_classification_prompt(batch)
+                response_body = await self._invoke_model(
+                    prompt, max_tokens=300 * len(batch)
+                )
+                batch_results = self._parse_batch_classification_response(
+                    response_body, len(batch)
+                )
+            except ClientError as e:
+                error_code = e.response["Error"]["Code"]
+                logger.error(f"AWS Bedrock error {error_code}: {e}")
+                raise Exception(f"Bedrock classification failed: {error_code}")
+            except Exception as e:
+                logger.error(f"Batch classification error: {e}")
+                raise Exception(f"Failed to classify documents: {str(e)}")
+
+            logger.info(f"Batch classification completed for {len(batch)} documents")
+            results.extend(batch_results)
+
+        return results
+
+    async def classify_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Classify several documents concurrently, one Bedrock call each.
+
+        Concurrency is bounded by the client's request semaphore.
+
+        Args:
+            texts: Extracted text for each document.
+
+        Returns:
+            List[Dict[str, Any]]: Classification results in the same order as texts.
+
+        Raises:
+            Exception: If any classification fails.
+        """
+        return await asyncio.gather(*(self.classify_document(text) for text in texts))
+
+    async def _invoke_model(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """
+        Send a single-message prompt to the Bedrock model.
+
+        Args:
+            prompt: User message content.
+            max_tokens: Maximum tokens to generate.
+
+        Returns:
+            Dict[str, Any]: Parsed response body.
+        """
+        # Prepare request body for Claude 3.5 Sonnet
+        request_body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "temperature": 0.2,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+
+        # Make async API call, limiting in-flight Bedrock requests
+        client = await self._get_client()
+        async with self._semaphore:
+            response = await client.invoke_model(
+                modelId=self.model_id,
+                body=json_dumps(request_body),
+                contentType="application/json",
+                accept="application/json",
+            )
+            body = await response["body"].read()
+
+        return json_loads(body)
+
+    def _classification_cache_key(self, text: str) -> bytes:
+        """
+        Build the classification cache key for document text.
+
+        Only the truncated text reaches the model, so documents that differ
+        beyond the truncation point share a key.
+
+        Args:
+            text: Document text.
+
+        Returns:
+            bytes: SHA-256 digest of the model ID and truncated text.
+        """
+        key_source = f"{self.model_id}\0{self._truncate_text(text)}"
+        return hashlib.sha256(key_source.encode("utf-8")).digest()
+
+    def _truncate_text(self, text: str) -> str:
+        """
+        Truncate document text to keep prompts within token limits.
+
+        Args:
+            text: Document text.
+
+        Returns:
+            str: Text of at most max_text_length characters plus an ellipsis.
+        """
+        max_text_length = self.max_text_length
+        if len(text) > max_text_length:
+            text = text[:max_text_length] + "..."
+        return text
+
     def _build_classification_prompt(self, text: str) -> str:
         """
         Build classification prompt with few-shot examples.
@@ -339,14 +835,105 @@ class BedrockClient:
         Returns:
             str: Formatted classification prompt.
         """
-        from .prompts import CLASSIFICATION_PROMPT_TEMPLATE
+        return (
+            _CLASSIFICATION_PROMPT_PREFIX
+            + self._truncate_text(text)
+            + _CLASSIFICATION_PROMPT_SUFFIX
+        )
 
-        # Truncate text if too long (keep within token limits)
-        max_text_length = 4000
-        if len(text) > max_text_length:
-            text = text[:max_text_length] + "..."
+    def _build_batch_classification_prompt(self, texts: List[str]) -> str:
+        """
+        Build a prompt that classifies several numbered documents at once.
+
+        Args:
+            texts: Document texts to classify.
+
+        Returns:
+            str: Formatted batch classification prompt.
+        """
+        documents = "\n\n".join(
+            BATCH_DOCUMENT_TEMPLATE.format(
+                index=index, extracted_text=self._truncate_text(text)
+            )
+            for index, text in enumerate(texts, start=1)
+        )
+
+        return BATCH_CLASSIFICATION_PROMPT_TEMPLATE.format(documents=documents)
+
+    def _get_completion_text(self, response_body: Dict[str, Any]) -> str:
+        """
+        Get the completion text from a Bedrock response body.
+
+        Args:
+            response_body: Response body from Bedrock API.
+
+        Returns:
+            str: Model completion text.
+        """
+        # Requests always use the Messages API, so the content array is the
+        # common case for every model
+        content = response_body.get("content")
+        if content:
+            for content_block in content:
+                if content_block.get("type") == "text":
+                    return content_block.get("text", "")
+            return ""
 
-        return CLASSIFICATION_PROMPT_TEMPLATE.format(extracted_text=text)
+        # Fallback to old text completion format
+        return response_body.get("completion", "")
+
+    def _parse_batch_classification_response(
+        self, response_body: Dict[str, Any], count: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse a batch classification response from Bedrock.
+
+        Args:
+            response_body: Response body from Bedrock API.
+            count: Number of documents in the batch.
+
+        Returns:
+            List[Dict[str, Any]]: One result per document, ordered by index.
+            Documents missing from the response are returned as Unknown.
+        """
+        results = [
+            {
+                "category": "Unknown",
+                "confidence": 0.0,
+                "reasoning": "No classification returned for this document",
+            }
+            for _ in range(count)
+        ]
+
+        try:
+            completion = self._get_completion_text(response_body)
+
+            json_start = completion.find("[")
+            if json_start == -1:
+                logger.warning("Batch classification response contained no JSON array")
+                return results
+
+            items, _ = _JSON_DECODER.raw_decode(completion, json_start)
+            if not isinstance(items, list):
+                logger.warning("Batch classification response contained no JSON array")
+                return results
+
+            for item in items:
+                try:
+                    index = int(item.get("index", 0))
+                    if 1 <= index <= count:
+                        results[index - 1] = {
+                            "category": item.get("category", "Unknown"),
+                            "confidence": float(item.get("confidence", 0.0)),
+                            "reasoning": item.get("reasoning", "No reasoning provided"),
+                        }
+                except (AttributeError, TypeError, ValueError) as e:
+                    logger.warning(f"Skipping malformed batch classification item: {e}")
+
+        except Exception as e:
+            logger.error(f"Error parsing batch classification response: {e}")
+
+        return results
 
     def _parse_classification_response(
         self, response_body: Dict[str, Any]
@@ -361,26 +948,13 @@ class BedrockClient:
             Dict[str, Any]: Parsed classification result.
         """
         try:
-            # Extract completion text from Claude 3.5 format
-            completion = ""
-            if "content" in response_body and response_body["content"]:
-                # Claude 3.5 format with content array
-                for content_block in response_body["content"]:
-                    if content_block.get("type") == "text":
-                        completion = content_block.get("text", "")
-                        break
-            else:
-                # Fallback to old format
-                completion = response_body.get("completion", "")
-
-            # Try to parse as JSON first
-            if "{" in completion and "}" in completion:
-                json_start = completion.find("{")
-                json_end = completion.rfind("}") + 1
-                json_str = completion[json_start:json_end]
+            completion = self._get_completion_text(response_body)
 
+            # Try to parse as JSON first, starting at the first opening brace
+            json_start = completion.find("{")
+            if json_start != -1:
                 try:
-                    result = json.loads(json_str)
+                    result, _ = _JSON_DECODER.raw_decode(completion, json_start)
                     return {
                         "category": result.get("category", "Unknown"),
                         "confidence": float(result.get("confidence", 0.0)),
@@ -389,22 +963,23 @@ class BedrockClient:
                 except json.JSONDecodeError:
                     pass
 
-            # Fallback: Parse text response
-            lines = completion.strip().split("\n")
+            # Fallback: Parse "field: value" lines, last occurrence wins
             category = "Unknown"
             confidence = 0.0
             reasoning = "Unable to parse response"
 
-            for line in lines:
-                if "category" in line.lower():
-                    category = line.split(":")[-1].strip().strip("\"'")
-                elif "confidence" in line.lower():
+            for match in _RESPONSE_FIELD_RE.finditer(completion):
+                field = match.group(1).lower()
+                value = match.group(2).strip("\"'")
+                if field == "category":
+                    category = value
+                elif field == "confidence":
                     try:
-                        confidence = float(line.split(":")[-1].strip())
+                        confidence = float(value)
                     except ValueError:
                         confidence = 0.0
-                elif "reasoning" in line.lower():
-                    reasoning = line.split(":")[-1].strip().strip("\"'")
+                else:
+                    reasoning = value
 
             return {
                 "category": category,
@@ -7,16 +7,11 @@ recall, F1-score, confusion matrix, and other evaluation metrics.
 
 import numpy as np
 import logging
-from typing import Dict, List, Any, Optional
-from sklearn.metrics import (
-    precision_recall_fscore_support,
-    accuracy_score,
-    confusion_matrix,
-)
-from collections import defaultdict, Counter
-import json
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 
+from ..utils.json_utils import json_dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +25,7 @@ class MetricsCalculator:
 
     def __init__(self):
         """Initialize metrics calculator."""
-        self.document_types = [
+        self.document_types = (
             "Government ID",
             "Payslip",
             "Bank Statement",
@@ -38,10 +33,237 @@ class MetricsCalculator:
             "Utility Bill",
             "Savings Statement",
             "Unknown",
+        )
+        self._label_index = {
+            doc_type: i for i, doc_type in enumerate(self.document_types)
+        }
+        self._n_classes = len(self.document_types)
+        # Most recent (y_true, y_pred, encoded labels) so that the metrics,
+        # confusion matrix and summary for one evaluation share a single pass.
+        # Copies of the input lists are kept and compared by content.
+        self._cm_cache: Optional[tuple] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the confusion matrix accumulated by update()."""
+        self._running_index = dict(self._label_index)
+        self._running_labels = list(self.document_types)
+        self._running_cm = np.zeros((self._n_classes, self._n_classes), dtype=np.int64)
+
+    def _encode_labels(
+        self,
+        y_true: List[str],
+        y_pred: List[str],
+        label_index: Optional[Dict[str, int]] = None,
+        labels: Optional[List[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Map string labels to integer codes.
+
+        Known document types keep their index in document_types; any other
+        label is assigned the next free code so it is never conflated with
+        another label.
+
+        Args:
+            y_true: True labels.
+            y_pred: Predicted labels.
+            label_index: Existing label to code mapping to extend in place.
+                Defaults to a fresh copy of the document type mapping.
+            labels: Label for each code in label_index, extended in place.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, List[str]]: Encoded true labels,
+            encoded predicted labels, and the label for each code.
+        """
+        if label_index is None or labels is None:
+            label_index = dict(self._label_index)
+            labels = list(self.document_types)
+
+        def encode(label: str) -> int:
+            index = label_index.get(label)
+            if index is None:
+                index = label_index[label] = len(labels)
+                labels.append(label)
+            return index
+
+        t = np.fromiter(map(encode, y_true), dtype=np.intp, count=len(y_true))
+        p = np.fromiter(map(encode, y_pred), dtype=np.intp, count=len(y_pred))
+        return t, p, labels
+
+    @staticmethod
+    def _confusion_matrix(t: np.ndarray, p: np.ndarray, n_labels: int) -> np.ndarray:
+        """
+        Build a confusion matrix from encoded labels with one histogram.
+
+        Args:
+            t: Encoded true labels.
+            p: Encoded predicted labels.
+            n_labels: Number of distinct label codes.
+
+        Returns:
+            np.ndarray: n_labels x n_labels matrix, rows are true labels.
+        """
+        return np.bincount(
+            t * n_labels + p, minlength=n_labels * n_labels
+        ).reshape(n_labels, n_labels)
+
+    def _compute_cm(
+        self, y_true: List[str], y_pred: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray, List[str], np.ndarray]:
+        """
+        Encode labels and build the full confusion matrix, memoized for the
+        most recent pair of label lists.
+
+        The memo is keyed on the lists' contents, so lists changed in place
+        between calls are re-encoded. Comparing to the stored copies is a C
+        loop that is cheap next to encoding each label in Python.
+
+        Args:
+            y_true: True labels.
+            y_pred: Predicted labels.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, List[str], np.ndarray]: Encoded true
+            labels, encoded predicted labels, the label for each code, and the
+            confusion matrix over all codes.
+        """
+        cache = self._cm_cache
+        if cache is not None and cache[0] == y_true and cache[1] == y_pred:
+            return cache[2]
+
+        t, p, labels = self._encode_labels(y_true, y_pred)
+        computed = (t, p, labels, self._confusion_matrix(t, p, len(labels)))
+        self._cm_cache = (list(y_true), list(y_pred), computed)
+        return computed
+
+    def _metrics_from_confusion_matrix(self, full_cm: np.ndarray) -> Dict[str, Any]:
+        """
+        Derive accuracy and per-class and averaged metrics from a confusion matrix.
+
+        Args:
+            full_cm: Confusion matrix over all label codes, rows are true labels.
+
+        Returns:
+            Dict[str, Any]: Accuracy, macro and weighted averages, per-class
+            metrics, and the confusion matrix over document_types.
+        """
+        tp = np.diag(full_cm)
+        support = full_cm.sum(axis=1)
+        predicted = full_cm.sum(axis=0)
+
+        # Overall accuracy
+        accuracy = tp.sum() / full_cm.sum()
+
+        # Per-class metrics, zero where undefined
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = np.where(predicted > 0, tp / predicted, 0.0)
+            recall = np.where(support > 0, tp / support, 0.0)
+            f1 = np.where(
+                support + predicted > 0, 2 * tp / (support + predicted), 0.0
+            )
+
+        # Macro and weighted averages over labels present in either list
+        present = (support + predicted) > 0
+        macro_precision = precision[present].mean()
+        macro_recall = recall[present].mean()
+        macro_f1 = f1[present].mean()
+
+        weights = support[present] / support[present].sum()
+        weighted_precision = (precision[present] * weights).sum()
+        weighted_recall = (recall[present] * weights).sum()
+        weighted_f1 = (f1[present] * weights).sum()
+
+        # Confusion matrix
+        n_types = self._n_classes
+        cm = full_cm[:n_types, :n_types]
+
+        # Per-class results, converting each array to Python scalars in bulk
+        per_class_metrics = [
+            {
+                "document_type": doc_type,
+                "precision": class_precision,
+                "recall": class_recall,
+                "f1_score": class_f1,
+                "support": class_support,
+            }
+            for doc_type, class_precision, class_recall, class_f1, class_support in zip(
+                self.document_types,
+                precision[:n_types].tolist(),
+                recall[:n_types].tolist(),
+                f1[:n_types].tolist(),
+                support[:n_types].tolist(),
+            )
         ]
 
+        return {
+            "overall_accuracy": float(accuracy),
+            "macro_avg": {
+                "precision": float(macro_precision),
+                "recall": float(macro_recall),
+                "f1_score": float(macro_f1),
+            },
+            "weighted_avg": {
+                "precision": float(weighted_precision),
+                "recall": float(weighted_recall),
+                "f1_score": float(weighted_f1),
+            },
+            "per_class_metrics": per_class_metrics,
+            "confusion_matrix": cm.tolist(),
+            "class_names": list(self.document_types),
+        }
+
+    def update(self, y_true: List[str], y_pred: List[str]) -> None:
+        """
+        Accumulate a batch of labels into the running confusion matrix.
+
+        Only the matrix is kept, so memory does not grow with the number of
+        samples. Call result() for the metrics and reset() to start over.
+
+        Args:
+            y_true: True labels for the batch.
+            y_pred: Predicted labels for the batch.
+        """
+        if len(y_true) != len(y_pred):
+            raise ValueError("y_true and y_pred must have same length")
+
+        t, p, labels = self._encode_labels(
+            y_true, y_pred, self._running_index, self._running_labels
+        )
+        n_labels = len(labels)
+        grow = n_labels - self._running_cm.shape[0]
+        if grow > 0:
+            # New labels outside document_types were seen in this batch
+            self._running_cm = np.pad(self._running_cm, ((0, grow), (0, grow)))
+
+        self._running_cm += self._confusion_matrix(t, p, n_labels)
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Calculate classification metrics from the batches passed to update().
+
+        Returns:
+            Dict[str, Any]: Metrics report in the same shape as
+            calculate_classification_metrics, without confidence metrics.
+        """
+        total_samples = int(self._running_cm.sum())
+        if total_samples == 0:
+            raise ValueError("No samples have been accumulated")
+
+        metrics = self._metrics_from_confusion_matrix(self._running_cm)
+        metrics.update(
+            {
+                "total_samples": total_samples,
+                "confidence_metrics": {},
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+        )
+        return metrics
+
     def calculate_classification_metrics(
-        self, y_true: List[str], y_pred: List[str], confidences: Optional[List[float]] = None
+        self,
+        y_true: List[str],
+        y_pred: List[str],
+        confidences: Optional[Union[List[float], np.ndarray]] = None,
     ) -> Dict[str, Any]:
         """
         Calculate comprehensive classification metrics.
@@ -61,80 +283,37 @@ class MetricsCalculator:
             raise ValueError("Input lists cannot be empty")
 
         try:
-            # Overall accuracy
-            accuracy = accuracy_score(y_true, y_pred)
-
-            # Per-class metrics
-            precision, recall, f1, support = precision_recall_fscore_support(
-                y_true,
-                y_pred,
-                average=None,
-                labels=self.document_types,
-                zero_division=0,
-            )
-
-            # Macro and weighted averages
-            macro_precision, macro_recall, macro_f1, _ = (
-                precision_recall_fscore_support(
-                    y_true, y_pred, average="macro", zero_division=0
-                )
-            )
-
-            weighted_precision, weighted_recall, weighted_f1, _ = (
-                precision_recall_fscore_support(
-                    y_true, y_pred, average="weighted", zero_division=0
-                )
-            )
-
-            # Confusion matrix
-            cm = confusion_matrix(y_true, y_pred, labels=self.document_types)
-
-            # Per-class results
-            per_class_metrics = []
-            for i, doc_type in enumerate(self.document_types):
-                per_class_metrics.append(
-                    {
-                        "document_type": doc_type,
-                        "precision": float(precision[i]) if i < len(precision) else 0.0,
-                        "recall": float(recall[i]) if i < len(recall) else 0.0,
-                        "f1_score": float(f1[i]) if i < len(f1) else 0.0,
-                        "support": int(support[i]) if i < len(support) else 0,
-                    }
-                )
-
+            # One confusion matrix over every label seen, from which all
+            # metrics are derived
+            t, p, labels, full_cm = self._compute_cm(y_true, y_pred)
             # Confidence-based metrics
             confidence_metrics = {}
-            if confidences:
+            if confidences is not None and len(confidences) > 0:
                 confidence_metrics = self._calculate_confidence_metrics(
-                    y_true, y_pred, confidences
+                    y_true, y_pred, confidences, t, p
                 )
 
-            return {
-                "overall_accuracy": float(accuracy),
-                "macro_avg": {
-                    "precision": float(macro_precision),
-                    "recall": float(macro_recall),
-                    "f1_score": float(macro_f1),
-                },
-                "weighted_avg": {
-                    "precision": float(weighted_precision),
-                    "recall": float(weighted_recall),
-                    "f1_score": float(weighted_f1),
-                },
-                "per_class_metrics": per_class_metrics,
-                "confusion_matrix": cm.tolist(),
-                "class_names": self.document_types,
-                "total_samples": len(y_true),
-                "confidence_metrics": confidence_metrics,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            metrics = self._metrics_from_confusion_matrix(full_cm)
+            metrics.update(
+                {
+                    "total_samples": len(y_true),
+                    "confidence_metrics": confidence_metrics,
+                    "timestamp": datetime.utcnow().isoformat(),
+                }
+            )
+            return metrics
 
         except Exception as e:
             logger.error(f"Error calculating metrics: {e}")
             raise
 
     def _calculate_confidence_metrics(
-        self, y_true: List[str], y_pred: List[str], confidences: List[float]
+        self,
+        y_true: List[str],
+        y_pred: List[str],
+        confidences: Union[List[float], np.ndarray],
+        t: Optional[np.ndarray] = None,
+        p: Optional[np.ndarray] = None,
     ) -> Dict[str, Any]:
         """
         Calculate confidence-based metrics.
@@ -142,38 +321,50 @@ class MetricsCalculator:
         Args:
             y_true: True labels.
             y_pred: Predicted labels.
-            confidences: Prediction confidences.
+            confidences: Prediction confidences. A float64 array is used
+                without copying.
+            t: Encoded true labels, if already computed by the caller.
+            p: Encoded predicted labels, if already computed by the caller.
 
         Returns:
             Dict[str, Any]: Confidence-based metrics.
         """
         try:
-            confidences = np.array(confidences)
-            correct_predictions = np.array([t == p for t, p in zip(y_true, y_pred)])
+            confidences = np.asarray(confidences, dtype=np.float64)
+            if t is None or p is None:
+                t, p, _ = self._encode_labels(y_true, y_pred)
+            correct_predictions = t == p
+            incorrect_predictions = ~correct_predictions
 
             # Average confidence
             avg_confidence = float(np.mean(confidences))
             avg_confidence_correct = float(np.mean(confidences[correct_predictions]))
             avg_confidence_incorrect = (
-                float(np.mean(confidences[~correct_predictions]))
-                if np.sum(~correct_predictions) > 0
+                float(np.mean(confidences[incorrect_predictions]))
+                if incorrect_predictions.any()
                 else 0.0
             )
 
-            # Confidence thresholds analysis
+            # Confidence thresholds analysis. Sorting once lets every threshold
+            # be located with a binary search instead of a full mask pass.
             thresholds = [0.5, 0.6, 0.7, 0.8, 0.9]
             threshold_analysis = []
 
-            for threshold in thresholds:
-                high_conf_mask = confidences >= threshold
-                if np.sum(high_conf_mask) > 0:
-                    high_conf_accuracy = float(
-                        np.mean(correct_predictions[high_conf_mask])
-                    )
-                    high_conf_count = int(np.sum(high_conf_mask))
-                    high_conf_percentage = float(
-                        high_conf_count / len(confidences) * 100
-                    )
+            order = np.argsort(confidences, kind="stable")
+            sorted_confidences = confidences[order]
+            # correct_before[i] = correct predictions among the i least confident
+            correct_before = np.concatenate(
+                ([0], np.cumsum(correct_predictions[order]))
+            ).tolist()
+            total = len(confidences)
+            cutoffs = np.searchsorted(sorted_confidences, thresholds, side="left").tolist()
+
+            for threshold, cutoff in zip(thresholds, cutoffs):
+                high_conf_count = total - cutoff
+                if high_conf_count > 0:
+                    high_conf_correct = correct_before[-1] - correct_before[cutoff]
+                    high_conf_accuracy = high_conf_correct / high_conf_count
+                    high_conf_percentage = high_conf_count / total * 100
                 else:
                     high_conf_accuracy = 0.0
                     high_conf_count = 0
@@ -188,15 +379,31 @@ class MetricsCalculator:
                     }
                 )
 
+            # The sorted copy already holds the min, max and median. NaN sorts
+            # last, in which case the reductions are used so it propagates.
+            if not np.isnan(sorted_confidences[-1]):
+                middle = total // 2
+                min_confidence = float(sorted_confidences[0])
+                max_confidence = float(sorted_confidences[-1])
+                median_confidence = float(
+                    sorted_confidences[middle]
+                    if total % 2
+                    else (sorted_confidences[middle - 1] + sorted_confidences[middle]) / 2
+                )
+            else:
+                min_confidence = float(np.min(confidences))
+                max_confidence = float(np.max(confidences))
+                median_confidence = float(np.median(confidences))
+
             return {
                 "average_confidence": avg_confidence,
                 "average_confidence_correct": avg_confidence_correct,
                 "average_confidence_incorrect": avg_confidence_incorrect,
                 "confidence_distribution": {
-                    "min": float(np.min(confidences)),
-                    "max": float(np.max(confidences)),
+                    "min": min_confidence,
+                    "max": max_confidence,
                     "std": float(np.std(confidences)),
-                    "median": float(np.median(confidences)),
+                    "median": median_confidence,
                 },
                 "threshold_analysis": threshold_analysis,
             }
@@ -220,20 +427,27 @@ class MetricsCalculator:
         """
         try:
             # Raw confusion matrix
-            cm = confusion_matrix(y_true, y_pred, labels=self.document_types)
+            _, _, _, full_cm = self._compute_cm(y_true, y_pred)
+            n_types = self._n_classes
+            cm = full_cm[:n_types, :n_types]
 
-            # Normalized confusion matrix
-            cm_normalized = cm.astype("float") / (cm.sum(axis=1, keepdims=True) + 1e-10)
+            # Normalized confusion matrix; the division promotes to float, and
+            # rows with no samples stay zero
+            row_sums = cm.sum(axis=1, keepdims=True)
+            total_samples = int(row_sums.sum())
+            row_sums[row_sums == 0] = 1
+            cm_normalized = cm / row_sums
+            normalized_matrix = cm_normalized.tolist()
 
-            # Convert to percentages
-            cm_percentage = cm_normalized * 100
+            # Convert to percentages, reusing the normalized buffer
+            cm_normalized *= 100
 
             return {
                 "raw_matrix": cm.tolist(),
-                "normalized_matrix": cm_normalized.tolist(),
-                "percentage_matrix": cm_percentage.tolist(),
-                "class_names": self.document_types,
-                "total_samples": int(np.sum(cm)),
+                "normalized_matrix": normalized_matrix,
+                "percentage_matrix": cm_normalized.tolist(),
+                "class_names": list(self.document_types),
+                "total_samples": total_samples,
             }
 
         except Exception as e:
@@ -307,9 +521,13 @@ class MetricsCalculator:
             return "stable"
 
         try:
-            # Simple linear trend
-            x = np.arange(len(values))
-            slope = np.polyfit(x, values, 1)[0]
+            # Least-squares slope against x = 0..n-1. With evenly spaced x the
+            # mean is (n - 1) / 2 and the sum of squared deviations is
+            # n(n^2 - 1) / 12, so no polynomial fit is needed.
+            y = np.asarray(values, dtype=np.float64)
+            n = y.size
+            x_deviation = np.arange(n) - (n - 1) / 2
+            slope = float(np.dot(y, x_deviation)) / (n * (n * n - 1) / 12)
 
             if slope > 0.01:  # 1% improvement threshold
                 return "improving"
@@ -329,8 +547,8 @@ class MetricsCalculator:
             filepath: Output file path.
         """
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(metrics, f, indent=2, ensure_ascii=False)
+            with open(filepath, "wb") as f:
+                f.write(json_dumps(metrics, indent=True))
 
             logger.info(f"Metrics report exported to {filepath}")
 
@@ -352,24 +570,30 @@ class MetricsCalculator:
             Dict[str, Any]: Classification summary.
         """
         try:
-            # Label distribution
-            true_distribution = dict(Counter(y_true))
-            pred_distribution = dict(Counter(y_pred))
+            t, p, labels, full_cm = self._compute_cm(y_true, y_pred)
 
-            # Correct predictions per class
-            correct_per_class = defaultdict(int)
-            for true_label, pred_label in zip(y_true, y_pred):
-                if true_label == pred_label:
-                    correct_per_class[true_label] += 1
+            # Label distribution, keyed in order of first appearance. The
+            # counts are the confusion matrix row and column sums.
+            true_distribution = self._first_appearance_counts(
+                t, full_cm.sum(axis=1), labels
+            )
+            pred_distribution = self._first_appearance_counts(
+                p, full_cm.sum(axis=0), labels
+            )
+
+            # Correct predictions per class, from the matrix diagonal
+            correct_per_class = self._first_appearance_counts(
+                t[t == p], np.diag(full_cm), labels
+            )
 
             # Overall statistics
             total_samples = len(y_true)
-            total_correct = sum(1 for t, p in zip(y_true, y_pred) if t == p)
+            total_correct = int(np.trace(full_cm))
 
             return {
                 "total_samples": total_samples,
                 "total_correct": total_correct,
-                "overall_accuracy": float(total_correct / total_samples),
+                "overall_accuracy": total_correct / total_samples,
                 "label_distribution": {
                     "true": true_distribution,
                     "predicted": pred_distribution,
@@ -390,6 +614,24 @@ class MetricsCalculator:
             logger.error(f"Error generating classification summary: {e}")
             return {}
 
+    @staticmethod
+    def _first_appearance_counts(
+        codes: np.ndarray, counts: np.ndarray, labels: List[str]
+    ) -> Dict[str, int]:
+        """
+        Map per-code counts to labels, ordered by first appearance like Counter.
+
+        Args:
+            codes: Encoded labels, in input order.
+            counts: Count for each code.
+            labels: Label for each code.
+
+        Returns:
+            Dict[str, int]: Count per label present in codes.
+        """
+        counts = counts.tolist()
+        return {labels[code]: counts[code] for code in dict.fromkeys(codes.tolist())}
+
     def _calculate_class_balance_score(self, distribution: Dict[str, int]) -> float:
         """
         Calculate class balance score (1.0 = perfectly balanced, 0.0 = highly imbalanced).
@@ -410,4 +652,4 @@ class MetricsCalculator:
         if max_count == 0:
             return 1.0
 
-        return float(min_count / max_count)
+        return min_count / max_count
@@ -5,7 +5,7 @@ This module handles environment variables and application settings using
 pydantic for validation and type safety.
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from dotenv import load_dotenv
 
@@ -52,15 +52,28 @@ class Settings(BaseSettings):
     TEXTRACT_CONFIDENCE_THRESHOLD: float = Field(
         default=0.95, description="Minimum confidence threshold for Textract extraction"
     )
+    TEXTRACT_TEMP_BUCKET: str = Field(
+        default="", description="S3 bucket for staging large PDFs for async Textract (disabled if empty)"
+    )
+    TEXTRACT_MAX_CONCURRENCY: int = Field(
+        default=5, description="Maximum in-flight Textract requests per client"
+    )
+    BEDROCK_MAX_CONCURRENCY: int = Field(
+        default=5, description="Maximum in-flight Bedrock requests per client"
+    )
+    BEDROCK_MAX_TEXT_LENGTH: int = Field(
+        default=4000, description="Characters of document text included in each classification prompt"
+    )
+    FALLBACK_MAX_TEXT_LENGTH: int = Field(
+        default=4200, description="Characters collected by pypdf fallback before skipping remaining pages"
+    )
 
-    class Config:
-        """Pydantic configuration."""
-
-        env_file = ".env"
-        case_sensitive = True
+    # Settings are read once at import and never change afterwards, so the
+    # instance is frozen to keep cached copies of its values valid
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
 
 
-# Global settings instance
+# Global settings instance, parsed once per process
 settings = Settings()
 
 
@@ -68,6 +81,9 @@ def get_settings() -> Settings:
     """
     Get application settings.
 
+    Returns the shared instance rather than constructing a new Settings,
+    which would re-read the environment and .env file.
+
     Returns:
         Settings: Application settings instance.
     """
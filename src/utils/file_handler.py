@@ -7,16 +7,43 @@ with content-based validation and size limits.
 
 import os
 import uuid
+import itertools
 # import magic  # Commented out - requires system libmagic
 import asyncio
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from fastapi import UploadFile, HTTPException
 import logging
 
 from .config import settings
+from .json_utils import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+PDF_HEADER = b"%PDF-"
+
+# Uploads are read in chunks so oversized files are rejected without
+# buffering them whole
+UPLOAD_READ_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of queued result files written in one executor hop
+RESULT_WRITE_BATCH_SIZE = 32
+
+# Upload filenames are a random per-process prefix plus a counter, so they
+# stay unique across processes and restarts without a urandom read per file
+_UPLOAD_NAME_PREFIX = uuid.uuid4().hex
+_upload_name_counter = itertools.count()
+
+
+def _reset_upload_names() -> None:
+    """Give a forked worker its own filename prefix."""
+    global _UPLOAD_NAME_PREFIX, _upload_name_counter
+    _UPLOAD_NAME_PREFIX = uuid.uuid4().hex
+    _upload_name_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_upload_names)
+
 
 class FileValidator:
     """
@@ -30,7 +57,8 @@ class FileValidator:
         """Initialize file validator with configuration."""
         self.max_file_size = settings.MAX_FILE_SIZE
         self.allowed_mime_types = {"application/pdf"}
-        self.allowed_extensions = {".pdf"}
+        # Tuple so it can be passed straight to str.endswith
+        self.allowed_extensions = (".pdf",)
 
     async def validate_pdf_file(self, file: UploadFile) -> Tuple[bytes, str]:
         """
@@ -51,34 +79,46 @@ class FileValidator:
                 raise HTTPException(status_code=400, detail="No filename provided")
 
             filename_lower = file.filename.lower()
-            if not any(filename_lower.endswith(ext) for ext in self.allowed_extensions):
+            if not filename_lower.endswith(self.allowed_extensions):
                 raise HTTPException(
                     status_code=400,
                     detail=f"Only PDF files are allowed. Got: {file.filename}",
                 )
 
-            # Read file content
-            content = await file.read()
-            await file.seek(0)  # Reset file pointer
-
-            # Check file size
-            if len(content) > self.max_file_size:
+            # Content-based validation using PDF header check, before reading
+            # the rest of the upload
+            header = await file.read(len(PDF_HEADER))
+            if not header.startswith(PDF_HEADER):
                 raise HTTPException(
-                    status_code=413,
-                    detail=f"File too large. Maximum size: {self.max_file_size / (1024*1024):.1f}MB",
+                    status_code=400, detail="Invalid PDF file - missing PDF header"
                 )
 
+            if file.size is not None:
+                # The multipart parser already spooled the upload and knows
+                # its size, so check it up front and read the rest in one call
+                if file.size > self.max_file_size:
+                    raise self._file_too_large()
+                content = header + await file.read()
+            else:
+                # Read the remaining content in chunks, stopping as soon as
+                # the size limit is exceeded
+                chunks = [header]
+                total_size = len(header)
+                while True:
+                    chunk = await file.read(UPLOAD_READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    total_size += len(chunk)
+                    if total_size > self.max_file_size:
+                        raise self._file_too_large()
+                    chunks.append(chunk)
+                content = b"".join(chunks)
+
             if len(content) < 100:  # Minimum viable PDF size
                 raise HTTPException(
                     status_code=400, detail="File too small to be a valid PDF"
                 )
 
-            # Content-based validation using PDF header check
-            if not content.startswith(b"%PDF-"):
-                raise HTTPException(
-                    status_code=400, detail="Invalid PDF file - missing PDF header"
-                )
-
             logger.info(
                 f"File validation successful: {file.filename} ({len(content)} bytes)"
             )
@@ -92,6 +132,18 @@ class FileValidator:
                 status_code=500, detail=f"File validation failed: {str(e)}"
             )
 
+    def _file_too_large(self) -> HTTPException:
+        """
+        Build the error for an upload over the size limit.
+
+        Returns:
+            HTTPException: 413 error naming the maximum size.
+        """
+        return HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {self.max_file_size / (1024*1024):.1f}MB",
+        )
+
 
 class FileStorage:
     """
@@ -120,8 +172,7 @@ class FileStorage:
             str: Unique filename.
         """
         _, ext = os.path.splitext(original_filename)
-        unique_id = str(uuid.uuid4())
-        return f"{unique_id}{ext}"
+        return f"{_UPLOAD_NAME_PREFIX}-{next(_upload_name_counter):x}{ext}"
 
     async def save_upload(self, content: bytes, filename: str) -> str:
         """
@@ -138,10 +189,9 @@ class FileStorage:
             unique_filename = self.generate_unique_filename(filename)
             file_path = os.path.join(self.upload_dir, unique_filename)
 
-            # Write file asynchronously
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, lambda: self._write_file_sync(file_path, content)
+            # Write file asynchronously in a single executor hop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_file_sync, file_path, content
             )
 
             logger.info(f"File saved: {unique_filename}")
@@ -171,11 +221,11 @@ class FileStorage:
         """
         try:
             file_path = os.path.join(self.upload_dir, filename)
-            if os.path.exists(file_path):
-                await asyncio.get_event_loop().run_in_executor(
-                    None, os.remove, file_path
-                )
-                logger.info(f"Cleaned up file: {filename}")
+            # Remove directly rather than checking existence on the event loop
+            await asyncio.get_running_loop().run_in_executor(None, os.remove, file_path)
+            logger.info(f"Cleaned up file: {filename}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to cleanup file {filename}: {e}")
 
@@ -187,16 +237,19 @@ class FileStorage:
             dict: Upload directory stats.
         """
         try:
-            files = os.listdir(self.upload_dir)
+            total_files = 0
             total_size = 0
 
-            for filename in files:
-                file_path = os.path.join(self.upload_dir, filename)
-                if os.path.isfile(file_path):
-                    total_size += os.path.getsize(file_path)
+            # scandir exposes the entry type from the directory read, so only
+            # one stat per file is needed for its size
+            with os.scandir(self.upload_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        total_files += 1
+                        total_size += entry.stat(follow_symlinks=False).st_size
 
             return {
-                "total_files": len(files),
+                "total_files": total_files,
                 "total_size_bytes": total_size,
                 "total_size_mb": total_size / (1024 * 1024),
             }
@@ -217,10 +270,18 @@ class ResultStorage:
         self.results_dir = settings.RESULTS_DIR
         os.makedirs(self.results_dir, exist_ok=True)
 
+        # Writer task and its queue are created on first save, since the
+        # storage is constructed before the event loop is running
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
     async def save_result(self, task_id: str, result: dict) -> None:
         """
         Save classification result.
 
+        Writes are handed to a background writer that coalesces concurrent
+        saves into one executor hop. This returns once the file is written.
+
         Args:
             task_id: Unique task identifier.
             result: Classification result dictionary.
@@ -228,11 +289,12 @@ class ResultStorage:
         try:
 
             result_file = os.path.join(self.results_dir, f"{task_id}.json")
+            data = json_dumps(result, indent=True)
 
-            # Write result file asynchronously
-            await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self._write_result_sync(result_file, result)
-            )
+            # Queue the write and wait for the writer to complete it
+            written = asyncio.get_running_loop().create_future()
+            await self._get_write_queue().put((result_file, data, written))
+            await written
 
             logger.info(f"Result saved: {task_id}")
 
@@ -240,18 +302,101 @@ class ResultStorage:
             logger.error(f"Error saving result {task_id}: {e}")
             raise
 
-    def _write_result_sync(self, file_path: str, result: dict) -> None:
+    def _get_write_queue(self) -> asyncio.Queue:
+        """
+        Get the write queue, starting the writer task if it is not running.
+
+        Returns:
+            asyncio.Queue: Queue of (file_path, data, future) writes.
+        """
+        task = self._writer_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(
+                self._writer_loop(self._write_queue)
+            )
+        return self._write_queue
+
+    async def _writer_loop(self, queue: asyncio.Queue) -> None:
         """
-        Write result file synchronously.
+        Drain queued result writes in batches.
+
+        Waits for one write, then takes whatever else is already queued, so
+        a lone save is not delayed and a burst shares one executor hop.
 
         Args:
-            file_path: Path to result file.
-            result: Result data.
+            queue: Queue of (file_path, data, future) writes.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < RESULT_WRITE_BATCH_SIZE:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                errors = await loop.run_in_executor(
+                    None,
+                    self._write_results_sync,
+                    [(file_path, data) for file_path, data, _ in batch],
+                )
+            except Exception as e:
+                errors = [e] * len(batch)
+
+            for (_, _, written), error in zip(batch, errors):
+                queue.task_done()
+                if written.done():  # Caller was cancelled
+                    continue
+                if error is None:
+                    written.set_result(None)
+                else:
+                    written.set_exception(error)
+
+    async def close(self) -> None:
+        """
+        Wait for queued result writes to finish, then stop the writer task.
         """
-        import json
+        task, self._writer_task = self._writer_task, None
+        queue, self._write_queue = self._write_queue, None
+        if task is None or task.done():
+            return
+        if task.get_loop() is not asyncio.get_running_loop():
+            return
+
+        await queue.join()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _write_results_sync(
+        self, writes: List[Tuple[str, bytes]]
+    ) -> List[Optional[Exception]]:
+        """
+        Write result files synchronously.
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        Args:
+            writes: (file_path, data) pairs to write.
+
+        Returns:
+            List[Optional[Exception]]: Error for each write, or None on success.
+        """
+        errors = []
+        for file_path, data in writes:
+            try:
+                with open(file_path, "wb") as f:
+                    f.write(data)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
 
     async def get_result(self, task_id: str) -> Optional[dict]:
         """
@@ -266,19 +411,17 @@ class ResultStorage:
         try:
             result_file = os.path.join(self.results_dir, f"{task_id}.json")
 
-            if not os.path.exists(result_file):
-                return None
-
-            # Read result file asynchronously
-            return await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self._read_result_sync(result_file)
+            # Read result file asynchronously; a missing file is checked for
+            # in the worker rather than with a blocking stat on the event loop
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._read_result_sync, result_file
             )
 
         except Exception as e:
             logger.error(f"Error reading result {task_id}: {e}")
             return None
 
-    def _read_result_sync(self, file_path: str) -> dict:
+    def _read_result_sync(self, file_path: str) -> Optional[dict]:
         """
         Read result file synchronously.
 
@@ -286,9 +429,12 @@ class ResultStorage:
             file_path: Path to result file.
 
         Returns:
-            dict: Result data.
+            Optional[dict]: Result data, or None if the file does not exist.
         """
-        import json
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        try:
+            # Unbuffered: the whole file is read in one call, so a
+            # BufferedReader would only add a copy
+            with open(file_path, "rb", buffering=0) as f:
+                return json_loads(f.read())
+        except FileNotFoundError:
+            return None
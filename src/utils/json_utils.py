@@ -0,0 +1,71 @@
+"""
+JSON encoding helpers with an optional orjson fast path.
+
+orjson is used when installed; otherwise these helpers fall back to the
+standard library json module with equivalent behavior.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Pretty-print with two-space indentation instead of the
+            compact form.
+
+    Returns:
+        bytes: Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(obj)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_str(obj: Any) -> str:
+    """
+    Serialize an object to compact JSON text.
+
+    For text sinks such as log messages; the standard library fallback
+    returns its str directly instead of encoding and decoding it again.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        str: JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: Encoded JSON document.
+
+    Returns:
+        Any: Decoded object.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
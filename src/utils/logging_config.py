@@ -7,19 +7,231 @@ log levels, and output destinations for monitoring and debugging.
 
 import os
 import sys
+import stat
+import time
+import queue
+import atexit
 import logging
 import logging.handlers
 from datetime import datetime
 from typing import Dict, Any, Optional
-import json
 
 from .config import settings
+from .json_utils import json_dumps_str
+
+# (epoch second, rendered "YYYY-MM-DDTHH:MM:SS") of the last metrics timestamp
+_iso_second_cache = (-1, "")
+
+
+def _utc_isoformat_now() -> str:
+    """
+    Render the current UTC time like datetime.utcnow().isoformat().
+
+    The date and time-of-day part is cached per second, so events logged
+    within the same second only format their microseconds.
+
+    Returns:
+        str: ISO 8601 timestamp with microseconds when non-zero.
+    """
+    global _iso_second_cache
+
+    now_us = time.time_ns() // 1000
+    second, microsecond = divmod(now_us, 1_000_000)
+
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = datetime.utcfromtimestamp(second).isoformat()
+        _iso_second_cache = (second, prefix)
+
+    if microsecond:
+        return f"{prefix}.{microsecond:06d}"
+    return prefix
+
+
+# Write buffer for each log file; records below ERROR are flushed when it fills
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that buffers writes and tracks the file size itself.
+
+    The stock handler stats the path, formats each record twice and seeks
+    to the end of the file for every record, then flushes after the write.
+    This handler formats once and keeps a running size in encoded bytes
+    instead of seeking. It flushes itself only for records at ERROR and
+    above, on rollover and on close; the queue listener also flushes it
+    whenever the log queue drains, so quiet periods do not leave records
+    sitting in the buffer.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        delay: bool = False,
+        errors: Optional[str] = None,
+        buffer_size: int = LOG_BUFFER_SIZE,
+    ):
+        self.buffer_size = buffer_size
+        self._size = 0
+        self._rotatable = True
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
+
+    def _open(self):
+        """Open the log file with a large write buffer and record its size."""
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        # One fstat of the opened file instead of two path lookups; never
+        # roll over anything other than a regular file (bpo-45401)
+        file_stat = os.fstat(stream.fileno())
+        self._rotatable = stat.S_ISREG(file_stat.st_mode)
+        self._size = file_stat.st_size if self._rotatable else 0
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a record, rolling the file over first if it would exceed maxBytes.
+
+        Args:
+            record: Log record to write.
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+
+            # maxBytes limits the file size on disk, so count encoded bytes
+            if msg.isascii():
+                msg_size = len(msg)
+            else:
+                msg_size = len(msg.encode(self.encoding or "utf-8", self.errors or "strict"))
+
+            if (
+                self.maxBytes > 0
+                and self._rotatable
+                and self._size + msg_size >= self.maxBytes
+            ):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+
+            self.stream.write(msg)
+            self._size += msg_size
+
+            # Keep errors on disk immediately so a crash cannot lose them
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the date and time of day once per second.
+
+    logging.Formatter.formatTime calls converter() and strftime for every
+    record; records logged within the same second reuse the cached string
+    and only add their milliseconds when no datefmt is given. The formatted
+    text is also kept on the record, so handlers sharing this formatter
+    (application.log, errors.log, classification.log) format it once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, rendered time) swapped as one tuple so the
+        # formatter can be shared between threads without a lock
+        self._time_cache = (-1, "")
+        # The format string is fixed, so search it for asctime only once
+        self._uses_time = super().usesTime()
+
+    def usesTime(self) -> bool:
+        return self._uses_time
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, rendered = self._time_cache
+        if second != cached_second:
+            rendered = time.strftime(
+                datefmt or self.default_time_format, self.converter(second)
+            )
+            self._time_cache = (second, rendered)
+
+        if datefmt or not self.default_msec_format:
+            return rendered
+        return self.default_msec_format % (rendered, record.msecs)
+
+    def format(self, record: logging.LogRecord) -> str:
+        cached = record.__dict__.get("_formatted")
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        text = super().format(record)
+        record._formatted = (self, text)
+        return text
+
+
+class _ExcludeLoggerFilter(logging.Filter):
+    """Filter that rejects records from one logger and its children."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not super().filter(record)
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue drains."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        # Busy periods stay buffered; the last record of a burst is written
+        # out right away instead of waiting for the buffer to fill
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+# Background listener writing queued records to the log files
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and close the file handlers of the listener."""
+    global _queue_listener
+
+    listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging() -> None:
     """
     Configure application logging with proper formatting and handlers.
+
+    File handlers run on a background QueueListener thread, so logging
+    calls only format the message and enqueue the record. Importing this
+    module does not configure logging; the entry point (main.py) calls
+    this once at startup, and calling it again replaces the handlers.
     """
+    # Replace the listener from any previous call
+    _stop_queue_listener()
+
     # Create logs directory
     log_dir = "logs"
     os.makedirs(log_dir, exist_ok=True)
@@ -31,13 +243,23 @@ def setup_logging() -> None:
     # Clear any existing handlers
     root_logger.handlers.clear()
 
+    # Skip per-record lookups no formatter uses: the caller's stack frame,
+    # thread, process and task (see "Optimization" in the logging HOWTO).
+    # The logger name already identifies the module.
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if hasattr(logging, "logAsyncioTasks"):
+        logging.logAsyncioTasks = False
+
     # Create formatters
-    detailed_formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)-20s | %(funcName)-20s | %(message)s",
+    detailed_formatter = CachedTimeFormatter(
+        fmt="%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    simple_formatter = logging.Formatter(
+    simple_formatter = CachedTimeFormatter(
         fmt="%(asctime)s | %(levelname)-8s | %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
     )
 
@@ -47,8 +269,12 @@ def setup_logging() -> None:
     console_handler.setFormatter(simple_formatter)
     root_logger.addHandler(console_handler)
 
+    # Metrics records never reach the root logger, but they share the queue,
+    # so the application-wide files explicitly skip them
+    not_metrics = _ExcludeLoggerFilter("metrics")
+
     # File handler for all logs
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         filename=os.path.join(log_dir, "application.log"),
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5,
@@ -56,10 +282,10 @@ def setup_logging() -> None:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
+    file_handler.addFilter(not_metrics)
 
     # Error file handler
-    error_handler = logging.handlers.RotatingFileHandler(
+    error_handler = BufferedRotatingFileHandler(
         filename=os.path.join(log_dir, "errors.log"),
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5,
@@ -67,10 +293,10 @@ def setup_logging() -> None:
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(error_handler)
+    error_handler.addFilter(not_metrics)
 
-    # Classification specific handler
-    classification_handler = logging.handlers.RotatingFileHandler(
+    # Classification specific handler, for records from the classification package
+    classification_handler = BufferedRotatingFileHandler(
         filename=os.path.join(log_dir, "classification.log"),
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=3,
@@ -78,28 +304,46 @@ def setup_logging() -> None:
     )
     classification_handler.setLevel(logging.INFO)
     classification_handler.setFormatter(detailed_formatter)
-
-    # Add classification handler to classification logger
-    classification_logger = logging.getLogger("src.classification")
-    classification_logger.addHandler(classification_handler)
+    classification_handler.addFilter(logging.Filter("src.classification"))
 
     # Performance metrics handler
-    metrics_handler = logging.handlers.RotatingFileHandler(
+    metrics_handler = BufferedRotatingFileHandler(
         filename=os.path.join(log_dir, "metrics.log"),
         maxBytes=5 * 1024 * 1024,  # 5MB
         backupCount=3,
         encoding="utf-8",
     )
     metrics_handler.setLevel(logging.INFO)
-    metrics_formatter = logging.Formatter("%(asctime)s | %(message)s")
+    metrics_formatter = CachedTimeFormatter("%(asctime)s | %(message)s")
     metrics_handler.setFormatter(metrics_formatter)
+    metrics_handler.addFilter(logging.Filter("metrics"))
+
+    # Single queue feeding all file handlers from a background thread
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(queue_handler)
+
+    # Classification records reach the queue through the root logger
+    logging.getLogger("src.classification").handlers.clear()
 
     # Create metrics logger
     metrics_logger = logging.getLogger("metrics")
     metrics_logger.setLevel(logging.INFO)
-    metrics_logger.addHandler(metrics_handler)
+    metrics_logger.handlers.clear()
+    metrics_logger.addHandler(queue_handler)
     metrics_logger.propagate = False  # Don't propagate to root logger
 
+    global _queue_listener
+    _queue_listener = _FlushingQueueListener(
+        log_queue,
+        file_handler,
+        error_handler,
+        classification_handler,
+        metrics_handler,
+        respect_handler_level=True,
+    )
+    _queue_listener.start()
+
     logging.info("Logging system initialized")
 
 
@@ -134,9 +378,12 @@ class MetricsLogger:
             extracted_text_length: Length of extracted text.
             success: Whether classification was successful.
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         metrics = {
             "event_type": "classification",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_isoformat_now(),
             "task_id": task_id,
             "filename": filename,
             "category": category,
@@ -146,7 +393,7 @@ class MetricsLogger:
             "success": success,
         }
 
-        self.logger.info(json.dumps(metrics))
+        self.logger.info(json_dumps_str(metrics))
 
     def log_upload_metrics(
         self,
@@ -168,9 +415,12 @@ class MetricsLogger:
             success: Whether upload was successful.
             error_message: Error message if failed.
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         metrics = {
             "event_type": "upload",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_isoformat_now(),
             "task_id": task_id,
             "filename": filename,
             "file_size_bytes": file_size_bytes,
@@ -179,7 +429,7 @@ class MetricsLogger:
             "error_message": error_message,
         }
 
-        self.logger.info(json.dumps(metrics))
+        self.logger.info(json_dumps_str(metrics))
 
     def log_system_metrics(
         self,
@@ -201,9 +451,12 @@ class MetricsLogger:
             aws_textract_healthy: Textract service health.
             aws_bedrock_healthy: Bedrock service health.
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         metrics = {
             "event_type": "system_health",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_isoformat_now(),
             "active_tasks": active_tasks,
             "queued_tasks": queued_tasks,
             "completed_tasks": completed_tasks,
@@ -212,7 +465,7 @@ class MetricsLogger:
             "aws_bedrock_healthy": aws_bedrock_healthy,
         }
 
-        self.logger.info(json.dumps(metrics))
+        self.logger.info(json_dumps_str(metrics))
 
 
 class PerformanceLogger:
@@ -223,6 +476,7 @@ class PerformanceLogger:
     def __init__(self):
         """Initialize performance logger."""
         self.logger = logging.getLogger("performance")
+        self.metrics_logger = logging.getLogger("metrics")
 
     def log_execution_time(
         self, operation: str, execution_time: float, metadata: Optional[Dict[str, Any]] = None
@@ -235,21 +489,26 @@ class PerformanceLogger:
             execution_time: Execution time in seconds.
             metadata: Additional metadata.
         """
+        # The structured record below is the source of truth; the readable
+        # line is only for debugging sessions
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Performance: {operation} took {execution_time:.3f}s")
+
+        if not self.metrics_logger.isEnabledFor(logging.INFO):
+            return
+
         log_data = {
             "operation": operation,
             "execution_time": execution_time,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_isoformat_now(),
         }
 
         if metadata:
             log_data.update(metadata)
 
-        self.logger.info(f"Performance: {operation} took {execution_time:.3f}s")
-
         # Log detailed data to metrics
-        metrics_logger = logging.getLogger("metrics")
         log_data["event_type"] = "performance"
-        metrics_logger.info(json.dumps(log_data))
+        self.metrics_logger.info(json_dumps_str(log_data))
 
 
 def get_metrics_logger() -> MetricsLogger:
@@ -270,7 +529,3 @@ def get_performance_logger() -> PerformanceLogger:
         PerformanceLogger: Performance logger instance.
     """
     return PerformanceLogger()
-
-
-# Initialize logging when module is imported
-setup_logging()
@@ -9,7 +9,9 @@ const CONFIG = {
     MAX_FILE_SIZE: 20 * 1024 * 1024, // 20MB
     SUPPORTED_TYPES: ['application/pdf'],
     POLL_INTERVAL: 2000, // 2 seconds
-    MAX_POLL_ATTEMPTS: 90 // 3 minutes max
+    POLL_INITIAL_INTERVAL: 100, // first task status poll, backs off to POLL_INTERVAL
+    POLL_BACKOFF: 1.5,
+    POLL_TIMEOUT: 3 * 60 * 1000 // 3 minutes max
 };
 
 // Utility functions
@@ -237,11 +239,11 @@ const TaskPoller = {
      * Start polling for task status
      */
     startPolling(taskId, callback, onComplete) {
-        let attempts = 0;
+        const deadline = Date.now() + CONFIG.POLL_TIMEOUT;
+        let delay = CONFIG.POLL_INITIAL_INTERVAL;
         
         const poll = async () => {
             try {
-                attempts++;
                 const status = await APIClient.getTaskStatus(taskId);
                 
                 callback(status);
@@ -249,13 +251,14 @@ const TaskPoller = {
                 if (status.status === 'completed' || status.status === 'failed') {
                     this.stopPolling(taskId);
                     if (onComplete) onComplete(status);
-                } else if (attempts >= CONFIG.MAX_POLL_ATTEMPTS) {
+                } else if (Date.now() >= deadline) {
                     this.stopPolling(taskId);
                     AlertSystem.error('Task polling timeout. Please check status manually.');
                 } else {
-                    // Continue polling
-                    const pollerId = setTimeout(poll, CONFIG.POLL_INTERVAL);
+                    // Continue polling, backing off so quick tasks finish fast
+                    const pollerId = setTimeout(poll, delay);
                     this.pollers.set(taskId, pollerId);
+                    delay = Math.min(CONFIG.POLL_INTERVAL, delay * CONFIG.POLL_BACKOFF);
                 }
             } catch (error) {
                 console.error('Polling error:', error);
@@ -0,0 +1,27 @@
+"""
+Tests for Bedrock response parsing in src.classification.tools.
+"""
+
+from src.classification.tools import BedrockClient
+
+
+def _response_body(text: str) -> dict:
+    """Wrap completion text in a Messages API response body."""
+    return {"content": [{"type": "text", "text": text}]}
+
+
+def test_parse_classification_response_fallback_handles_crlf():
+    """CRLF line endings must not leak into the parsed field values."""
+    completion = (
+        "Category: Payslip\r\n"
+        "Confidence: 0.85\r\n"
+        "Reasoning: Shows gross and net pay for the period\r\n"
+    )
+
+    result = BedrockClient()._parse_classification_response(_response_body(completion))
+
+    assert result == {
+        "category": "Payslip",
+        "confidence": 0.85,
+        "reasoning": "Shows gross and net pay for the period",
+    }